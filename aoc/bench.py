@@ -0,0 +1,242 @@
+import argparse
+import contextlib
+import dataclasses
+import io
+import json
+import logging
+import math
+import pathlib
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import typing
+
+from aoc import metrics
+from aoc.discover import Solution, discover_solutions
+from aoc.solver import SolveFn
+
+
+ScaleFn = typing.Callable[[str, int], str]
+
+
+def scale_lines(text: str, factor: int) -> str:
+    return "\n".join([text.rstrip("\n")] * factor) + "\n"
+
+
+def scale_blocks(text: str, factor: int) -> str:
+    return "\n\n".join([text.strip("\n")] * factor) + "\n"
+
+
+def scale_tokens(text: str, factor: int) -> str:
+    return " ".join([text.strip()] * factor) + "\n"
+
+
+def scale_digits(text: str, factor: int) -> str:
+    return text.strip() * factor + "\n"
+
+
+# inputs without an entry are scaled by repeating their lines; None means the input has no meaningful scaled form
+_scalers: dict[str, ScaleFn | None] = {
+    "d5": None,
+    "d9": scale_digits,
+    "d11": scale_tokens,
+    "d13": scale_blocks,
+    "d15": None,
+    "d17": None,
+}
+
+
+@dataclasses.dataclass
+class BenchResult:
+    solution: str
+    scale: int
+    answer: str
+    times: list[float]
+    peak_memory: int
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.times)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.times, 95)
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def quiet_run(solve_fn: SolveFn, input_file: pathlib.Path) -> str:
+    # solvers print progress, grids and warnings freely; keep the report readable
+    logging.disable(logging.CRITICAL)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            metrics.reset()
+            return solve_fn(input_file)
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def bench_solution(
+    solve_fn: SolveFn, input_file: pathlib.Path, warmup: int, repeat: int
+) -> tuple[str, list[float], int]:
+    answer = ""
+
+    for _ in range(warmup):
+        answer = quiet_run(solve_fn, input_file)
+
+    times: list[float] = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        answer = quiet_run(solve_fn, input_file)
+        times.append(time.perf_counter() - start)
+
+    # memory gets its own run since tracemalloc would skew the timings
+    tracemalloc.start()
+
+    try:
+        quiet_run(solve_fn, input_file)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return answer, times, peak_memory
+
+
+def scaled_input(input_file: pathlib.Path, day: str, factor: int, directory: pathlib.Path) -> pathlib.Path | None:
+    if factor == 1:
+        return input_file
+
+    scale_fn = _scalers.get(day, scale_lines)
+
+    if scale_fn is None:
+        return None
+
+    # keep the file name: some days pick their grid size from it
+    scaled_file = directory / f"x{factor}" / input_file.name
+    scaled_file.parent.mkdir(parents=True, exist_ok=True)
+    scaled_file.write_text(scale_fn(input_file.read_text(), factor))
+
+    return scaled_file
+
+
+def run(
+    solutions: list[Solution], inputs: str, scales: list[int], warmup: int, repeat: int
+) -> typing.Generator[BenchResult, None, None]:
+    with tempfile.TemporaryDirectory(prefix="aoc-bench-") as tmp:
+        for solution in solutions:
+            input_file = pathlib.Path(inputs.format(day=solution.day))
+
+            if not input_file.exists():
+                logging.warning(f"{solution.name}: no input at {input_file}")
+                continue
+
+            solve_fn = solution.load()
+
+            for factor in scales:
+                scaled_file = scaled_input(input_file, solution.day, factor, pathlib.Path(tmp, solution.day))
+
+                if scaled_file is None:
+                    logging.info(f"{solution.name}: x{factor} skipped, input does not scale")
+                    continue
+
+                try:
+                    answer, times, peak_memory = bench_solution(solve_fn, scaled_file, warmup, repeat)
+                except Exception as e:
+                    logging.error(f"{solution.name}: x{factor} failed: {e!r}")
+                    break
+
+                yield BenchResult(solution.name, factor, answer, times, peak_memory)
+
+
+def result_key(result: BenchResult) -> str:
+    return f"{result.solution}@x{result.scale}"
+
+
+def compare(
+    results: list[BenchResult], baseline: dict[str, dict], tolerance: float, min_delta: float = 0.005
+) -> list[str]:
+    regressions: list[str] = []
+
+    for result in results:
+        previous = baseline.get(result_key(result))
+
+        if previous is None:
+            continue
+
+        # sub-millisecond runs swing by multiples on timer noise alone, so a slowdown also has to clear min_delta
+        limit = max(previous["median"] * (1 + tolerance), previous["median"] + min_delta)
+
+        if result.median > limit:
+            regressions.append(
+                f"{result_key(result)}: median {result.median:.4f}s exceeds baseline {previous['median']:.4f}s"
+                f" by more than {tolerance:.0%}"
+            )
+
+        if previous["answer"] != result.answer:
+            regressions.append(f"{result_key(result)}: answer changed from {previous['answer']} to {result.answer}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench")
+    parser.add_argument("--root", type=pathlib.Path, default=pathlib.Path.cwd())
+    parser.add_argument("--inputs", default="data/{day}.txt", help="input path pattern, {day} becomes e.g. d7")
+    parser.add_argument("--days", nargs="*", help="only these days, e.g. d1 d7")
+    parser.add_argument("--scales", type=int, nargs="*", default=[1, 2, 10, 100])
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=pathlib.Path, help="json baseline to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before a run fails")
+    parser.add_argument(
+        "--min-delta", type=float, default=0.005, help="ignore slowdowns smaller than this many seconds"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(format="%(levelname).2s: %(message)s", level=logging.WARNING)
+
+    sys.path.insert(0, str(args.root))
+
+    solutions = discover_solutions(args.root, args.days)
+    results: list[BenchResult] = []
+
+    print(f"{'solution':<10} {'scale':>6} {'median':>10} {'p95':>10} {'memory':>10}  answer")
+
+    for result in run(solutions, args.inputs, args.scales, args.warmup, args.repeat):
+        results.append(result)
+
+        print(
+            f"{result.solution:<10} {'x' + str(result.scale):>6} {result.median:>9.4f}s {result.p95:>9.4f}s"
+            f" {metrics.format_bytes(result.peak_memory):>10}  {result.answer}"
+        )
+
+    regressions: list[str] = []
+
+    if args.baseline is not None and args.baseline.exists() and not args.save_baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance, args.min_delta)
+
+        for regression in regressions:
+            print("REGRESSION " + regression)
+
+    if args.baseline is not None and args.save_baseline:
+        record = {
+            result_key(r): {"median": r.median, "p95": r.p95, "peak_memory": r.peak_memory, "answer": r.answer}
+            for r in results
+        }
+        args.baseline.write_text(json.dumps(record, indent=2) + "\n")
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+from aoc.bench import BenchResult, compare, percentile, scale_blocks, scale_digits, scale_lines, scale_tokens
+
+
+def test_scalers():
+    assert scale_lines("1 2\n3 4\n", 2) == "1 2\n3 4\n1 2\n3 4\n"
+    assert scale_blocks("a\nb\n", 2) == "a\nb\n\na\nb\n"
+    assert scale_tokens("125 17\n", 2) == "125 17 125 17\n"
+    assert scale_digits("2333\n", 2) == "23332333\n"
+
+
+def test_percentile():
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([float(i) for i in range(1, 21)], 95) == 19.0
+    assert percentile([5.0], 95) == 5.0
+
+
+def test_compare():
+    results = [
+        BenchResult("d1/a", 1, "result=1", [1.0, 1.0, 1.0], 0),
+        BenchResult("d1/b", 1, "result=2", [2.0, 2.0, 2.0], 0),
+    ]
+    baseline = {
+        "d1/a@x1": {"median": 0.9, "answer": "result=1"},
+        "d1/b@x1": {"median": 1.0, "answer": "result=3"},
+    }
+
+    regressions = compare(results, baseline, 0.25)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("d1/b@x1: median")
+    assert regressions[1].startswith("d1/b@x1: answer changed")
+
+
+def test_compare_ignores_small_absolute_slowdowns():
+    results = [BenchResult("d1/b", 2, "result=2", [0.0006, 0.0006, 0.0006], 0)]
+    baseline = {"d1/b@x2": {"median": 0.0001, "answer": "result=2"}}
+
+    assert compare(results, baseline, 0.25) == []
+    assert len(compare(results, baseline, 0.25, min_delta=0.0)) == 1
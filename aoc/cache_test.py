@@ -0,0 +1,47 @@
+import os
+import pathlib
+
+from aoc.cache import ResultCache
+
+
+def test_round_trip(tmp_path: pathlib.Path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1 2 3\n")
+    source_file = tmp_path / "a.py"
+    source_file.write_text("def solve(input_file): ...\n")
+
+    cache = ResultCache(tmp_path / "cache", 1 << 20)
+    key = cache.key(input_file, source_file)
+
+    assert cache.get(key) is None
+
+    cache.put(key, "result=6")
+
+    assert cache.get(key) == "result=6"
+
+    input_file.write_text("1 2 4\n")
+
+    assert cache.key(input_file, source_file) != key
+
+    renamed_file = tmp_path / "input_sample.txt"
+    renamed_file.write_text("1 2 4\n")
+
+    assert cache.key(renamed_file, source_file) != cache.key(input_file, source_file)
+
+
+def test_evicts_least_recently_used(tmp_path: pathlib.Path):
+    cache = ResultCache(tmp_path, 1 << 20)
+
+    for i, key in enumerate(["old", "used", "new"]):
+        cache.put(key, "result=" + key)
+        os.utime(tmp_path / f"{key}.json", (i, i))
+
+    cache.get("old")
+
+    entry_size = (tmp_path / "new.json").stat().st_size
+    cache.max_bytes = 2 * entry_size + 10
+    cache.evict()
+
+    assert cache.get("used") is None
+    assert cache.get("old") == "result=old"
+    assert cache.get("new") == "result=new"
@@ -0,0 +1,130 @@
+import typing
+
+
+Presses = tuple[int, int]
+
+A_COST = 3
+B_COST = 1
+
+
+def _extended_gcd(a: int, b: int) -> tuple[int, int, int]:
+    # returns g, x, y with a * x + b * y == g
+    x0, y0, x1, y1 = 1, 0, 0, 1
+
+    while b:
+        q, r = divmod(a, b)
+        a, b = b, r
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+
+    return a, x0, y0
+
+
+def _solve_line(u: int, v: int, w: int, max_presses: int | None = None) -> Presses | None:
+    # cheapest non-negative a, b with a * u + b * v == w, each at most max_presses when given
+    if u == 0 and v == 0:
+        return (0, 0) if w == 0 else None
+
+    if u == 0 or v == 0:
+        step = u or v
+        if w % step != 0 or w // step < 0 or (max_presses is not None and w // step > max_presses):
+            return None
+        return (w // step, 0) if u else (0, w // step)
+
+    g, x, y = _extended_gcd(u, v)
+    if w % g != 0:
+        return None
+
+    # every solution is (a0 + k * step_a, b0 + k * step_b)
+    a0, b0 = x * (w // g), y * (w // g)
+    step_a, step_b = v // g, -u // g
+
+    low: int | None = None
+    high: int | None = None
+
+    # each constraint is start + k * step >= 0; a cap adds cap - press >= 0 for both buttons
+    constraints = [(a0, step_a), (b0, step_b)]
+    if max_presses is not None:
+        constraints += [(max_presses - a0, -step_a), (max_presses - b0, -step_b)]
+
+    for start, step in constraints:
+        if step > 0:
+            bound = -(start // step)
+            low = bound if low is None else max(low, bound)
+        else:
+            bound = start // -step
+            high = bound if high is None else min(high, bound)
+
+    if low is not None and high is not None and low > high:
+        return None
+
+    # cost is linear in k, so the optimum sits on whichever end the slope points away from
+    slope = A_COST * step_a + B_COST * step_b
+    k = low if slope >= 0 else high
+    assert k is not None
+    return a0 + k * step_a, b0 + k * step_b
+
+
+def solve_presses(
+    ax: int, ay: int, bx: int, by: int, px: int, py: int, max_presses: int | None = None
+) -> Presses | None:
+    det = ax * by - ay * bx
+
+    if det != 0:
+        # Cramer's rule, kept in integers so 10^13 offsets never lose precision
+        a, a_remainder = divmod(px * by - py * bx, det)
+        b, b_remainder = divmod(ax * py - ay * px, det)
+
+        if a_remainder or b_remainder or a < 0 or b < 0:
+            return None
+
+        if max_presses is not None and max(a, b) > max_presses:
+            return None
+
+        return a, b
+
+    # collinear buttons: the prize has to lie on the same line, then it is a one dimensional problem. The cap has
+    # to go into the line solver, the cheapest uncapped solution can be over it while a dearer one is not
+    if ax * py - ay * px != 0 or bx * py - by * px != 0:
+        return None
+
+    if ax or bx or px:
+        return _solve_line(ax, bx, px, max_presses)
+
+    return _solve_line(ay, by, py, max_presses)
+
+
+def tokens(ax: int, ay: int, bx: int, by: int, px: int, py: int, max_presses: int | None = None) -> int:
+    presses = solve_presses(ax, ay, bx, by, px, py, max_presses)
+
+    if presses is None:
+        return 0
+
+    return presses[0] * A_COST + presses[1] * B_COST
+
+
+def total_tokens(
+    columns: typing.Sequence[typing.Sequence[int]], prize_offset: int = 0, max_presses: int | None = None
+) -> int:
+    # batch form over the six parsed columns: button a x/y, button b x/y, prize x/y
+    result = 0
+
+    for ax, ay, bx, by, px, py in zip(*columns, strict=True):
+        px += prize_offset
+        py += prize_offset
+        det = ax * by - ay * bx
+
+        if det == 0:
+            result += tokens(ax, ay, bx, by, px, py, max_presses)
+            continue
+
+        a, a_remainder = divmod(px * by - py * bx, det)
+        b, b_remainder = divmod(ax * py - ay * px, det)
+
+        if a_remainder or b_remainder or a < 0 or b < 0:
+            continue
+
+        if max_presses is None or (a <= max_presses and b <= max_presses):
+            result += a * A_COST + b * B_COST
+
+    return result
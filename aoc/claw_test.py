@@ -0,0 +1,71 @@
+import random
+
+from aoc.claw import solve_presses, tokens, total_tokens
+
+
+def brute_force(ax: int, ay: int, bx: int, by: int, px: int, py: int) -> int:
+    costs = [a * 3 + b for a in range(101) for b in range(101) if a * ax + b * bx == px and a * ay + b * by == py]
+    return min(costs, default=0)
+
+
+def test_solve_presses():
+    assert solve_presses(94, 34, 22, 67, 8400, 5400) == (80, 40)
+    assert solve_presses(26, 66, 67, 21, 12748, 12176) is None
+    assert tokens(17, 86, 84, 37, 7870, 6450) == 200
+    assert tokens(26, 66, 67, 21, 10000000012748, 10000000012176) == 459236326669
+    assert tokens(26, 66, 67, 21, 10000000012748, 10000000012176, max_presses=100) == 0
+
+
+def test_collinear_buttons():
+    # b moves twice as far as a for a third of the price per step
+    assert solve_presses(1, 1, 2, 2, 10, 10) == (0, 5)
+    assert solve_presses(2, 2, 3, 3, 7, 7) == (2, 1)
+    assert solve_presses(1, 1, 2, 2, 10, 11) is None
+    assert solve_presses(0, 0, 0, 0, 0, 0) == (0, 0)
+    assert solve_presses(0, 0, 0, 5, 0, 10) == (0, 2)
+
+
+def test_matches_brute_force():
+    rng = random.Random(13)
+
+    columns: list[list[int]] = [[] for _ in range(6)]
+    expected = 0
+
+    for _ in range(300):
+        ax, ay, bx, by = (rng.randint(0, 6) for _ in range(4))
+        if rng.random() < 0.3:
+            bx, by = ax * 2, ay * 2
+        a, b = rng.randint(0, 30), rng.randint(0, 30)
+        px, py = a * ax + b * bx + rng.choice([0, 0, 1]), a * ay + b * by
+
+        machine = (ax, ay, bx, by, px, py)
+        for column, value in zip(columns, machine):
+            column.append(value)
+
+        assert tokens(*machine, max_presses=100) == brute_force(*machine), machine
+        expected += brute_force(*machine)
+
+    assert total_tokens(columns, max_presses=100) == expected
+
+
+def test_collinear_buttons_respect_the_cap():
+    # the cheapest uncapped answer is (0, 150); within the cap only (100, 100) is left
+    assert tokens(1, 1, 2, 2, 300, 300) == 150
+    assert tokens(1, 1, 2, 2, 300, 300, max_presses=100) == 400
+    assert tokens(1, 1, 2, 2, 301, 301, max_presses=100) == 0
+
+
+def test_collinear_matches_brute_force_near_the_cap():
+    rng = random.Random(29)
+
+    for _ in range(300):
+        ax, ay = rng.randint(1, 5), rng.randint(0, 5)
+        scale = rng.choice([2, 3, 5])
+        bx, by = ax * scale, ay * scale
+        if rng.random() < 0.5:
+            ax, ay, bx, by = bx, by, ax, ay
+        a, b = rng.randint(60, 120), rng.randint(60, 120)
+        machine = (ax, ay, bx, by, a * ax + b * bx, a * ay + b * by)
+
+        assert tokens(*machine, max_presses=100) == brute_force(*machine), machine
+        assert total_tokens([[value] for value in machine], max_presses=100) == brute_force(*machine), machine
@@ -0,0 +1,64 @@
+import ast
+import dataclasses
+import importlib
+import logging
+import pathlib
+import re
+
+from aoc.solver import SolveFn
+
+
+_day_pattern = re.compile(r"d(\d+)")
+
+
+@dataclasses.dataclass
+class Solution:
+    day: str
+    part: str
+    path: pathlib.Path
+
+    @property
+    def name(self) -> str:
+        return f"{self.day}/{self.part}"
+
+    @property
+    def module_name(self) -> str:
+        return f"{self.day}.{self.part}"
+
+    def load(self) -> SolveFn:
+        return importlib.import_module(self.module_name).solve
+
+
+def defines_solve(path: pathlib.Path) -> bool:
+    # parse instead of importing: some scripts (d17/b.py) do all of their work at import time
+    try:
+        tree = ast.parse(path.read_text(), filename=str(path))
+    except SyntaxError as e:
+        logging.warning(f"skipping {path}: {e}")
+        return False
+
+    return any(isinstance(node, ast.FunctionDef) and node.name == "solve" for node in tree.body)
+
+
+def discover_solutions(root: pathlib.Path, days: list[str] | None = None) -> list[Solution]:
+    solutions: list[Solution] = []
+
+    for day_path in root.iterdir():
+        match = _day_pattern.fullmatch(day_path.name)
+
+        # d0 holds the template for new days
+        if not day_path.is_dir() or match is None or match.group(1) == "0":
+            continue
+
+        if days is not None and day_path.name not in days:
+            continue
+
+        for part in ("a", "b"):
+            path = day_path / f"{part}.py"
+
+            if path.exists() and defines_solve(path):
+                solutions.append(Solution(day_path.name, part, path))
+
+    solutions.sort(key=lambda s: (int(s.day[1:]), s.part))
+
+    return solutions
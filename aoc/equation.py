@@ -0,0 +1,124 @@
+import concurrent.futures
+import dataclasses
+import time
+import typing
+
+
+Equation = tuple[int, list[int]]
+# called with (equations done, equations total)
+Progress = typing.Callable[[int, int], None]
+
+
+@dataclasses.dataclass(frozen=True)
+class Operator:
+    symbol: str
+    apply: typing.Callable[[int, int], int]
+    # given the result and the right operand, the left operand that produces it, or None if there is none
+    undo: typing.Callable[[int, int], int | None]
+
+
+def _add(left: int, right: int) -> int:
+    return left + right
+
+
+def _multiply(left: int, right: int) -> int:
+    return left * right
+
+
+def _undo_add(result: int, right: int) -> int | None:
+    return result - right if result >= right else None
+
+
+def _undo_multiply(result: int, right: int) -> int | None:
+    return result // right if right != 0 and result % right == 0 else None
+
+
+def _concatenate(left: int, right: int) -> int:
+    return left * 10 ** len(str(right)) + right
+
+
+def _undo_concatenate(result: int, right: int) -> int | None:
+    scale = 10 ** len(str(right))
+    return result // scale if result >= right and result % scale == right else None
+
+
+# module level functions rather than lambdas so the operators pickle into worker processes
+ADD = Operator("+", _add, _undo_add)
+MULTIPLY = Operator("*", _multiply, _undo_multiply)
+CONCATENATE = Operator("||", _concatenate, _undo_concatenate)
+
+
+def is_solvable(test_value: int, operands: typing.Sequence[int], operators: typing.Sequence[Operator]) -> bool:
+    # operators apply left to right, so the last operand is always the last one applied; peel operands off the
+    # end and drop every branch whose operator cannot be undone. The undo rules assume non-negative operands.
+    stack = [(test_value, len(operands) - 1)]
+
+    while stack:
+        value, last = stack.pop()
+
+        if last == 0:
+            if value == operands[0]:
+                return True
+            continue
+
+        for operator in operators:
+            left = operator.undo(value, operands[last])
+
+            if left is not None:
+                stack.append((left, last - 1))
+
+    return False
+
+
+def evaluate(operands: typing.Sequence[int], operators: typing.Sequence[Operator]) -> int:
+    result = operands[0]
+
+    for operator, operand in zip(operators, operands[1:], strict=True):
+        result = operator.apply(result, operand)
+
+    return result
+
+
+def _sum_solvable(equations: list[Equation], operators: typing.Sequence[Operator]) -> int:
+    return sum(test_value for test_value, operands in equations if is_solvable(test_value, operands, operators))
+
+
+def calibration_sum(
+    equations: list[Equation],
+    operators: typing.Sequence[Operator],
+    jobs: int = 1,
+    chunk_size: int = 512,
+    progress: Progress | None = None,
+    progress_interval: float = 0.25,
+) -> int:
+    chunks = [equations[i : i + chunk_size] for i in range(0, len(equations), chunk_size)]
+
+    result = 0
+    done = 0
+    last_report = time.monotonic()
+
+    def report(chunk: list[Equation]) -> None:
+        nonlocal done, last_report
+        done += len(chunk)
+
+        # a callback per chunk can still flood a terminal, so hold it to one call per interval plus the final one
+        if progress is not None and (done == len(equations) or time.monotonic() - last_report >= progress_interval):
+            last_report = time.monotonic()
+            progress(done, len(equations))
+
+    if jobs <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            result += _sum_solvable(chunk, operators)
+            report(chunk)
+
+        return result
+
+    # the total is a plain sum, so finishing order does not change the answer
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(_sum_solvable, chunk, operators): chunk for chunk in chunks}
+
+        for future in concurrent.futures.as_completed(futures):
+            result += future.result()
+            report(futures[future])
+
+    return result
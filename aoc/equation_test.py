@@ -0,0 +1,69 @@
+import itertools
+import random
+
+from aoc.equation import ADD, CONCATENATE, MULTIPLY, Operator, calibration_sum, evaluate, is_solvable
+
+
+def test_add_multiply():
+    assert is_solvable(190, [10, 19], [ADD, MULTIPLY])
+    assert is_solvable(3267, [81, 40, 27], [ADD, MULTIPLY])
+    assert is_solvable(292, [11, 6, 16, 20], [ADD, MULTIPLY])
+    assert not is_solvable(156, [15, 6], [ADD, MULTIPLY])
+    assert not is_solvable(21037, [9, 7, 18, 13], [ADD, MULTIPLY])
+
+
+def test_concatenate():
+    assert is_solvable(156, [15, 6], [ADD, MULTIPLY, CONCATENATE])
+    assert is_solvable(7290, [6, 8, 6, 15], [ADD, MULTIPLY, CONCATENATE])
+    assert is_solvable(192, [17, 8, 14], [ADD, MULTIPLY, CONCATENATE])
+    assert not is_solvable(161, [16, 10, 13], [ADD, MULTIPLY, CONCATENATE])
+
+
+def test_matches_brute_force():
+    rng = random.Random(7)
+    operators = [ADD, MULTIPLY, CONCATENATE]
+
+    for _ in range(200):
+        operands = [rng.randint(1, 20) for _ in range(rng.randint(1, 5))]
+        chosen = [rng.choice(operators) for _ in operands[1:]]
+        test_value = evaluate(operands, chosen) + rng.choice([0, 0, 1])
+
+        expected = any(
+            evaluate(operands, combination) == test_value
+            for combination in itertools.product(operators, repeat=len(operands) - 1)
+        )
+
+        assert is_solvable(test_value, operands, operators) == expected
+
+
+def test_custom_operator():
+    xor = Operator("^", lambda left, right: left ^ right, lambda result, right: result ^ right)
+
+    assert is_solvable(6, [3, 5], [xor])
+    assert not is_solvable(6, [3, 5], [ADD])
+
+
+def test_many_operands():
+    operands = list(range(1, 16))
+    test_value = evaluate(operands, [MULTIPLY, CONCATENATE, ADD] * 4 + [ADD, ADD])
+
+    assert is_solvable(test_value, operands, [ADD, MULTIPLY, CONCATENATE])
+    assert not is_solvable(test_value + 1, operands, [ADD, MULTIPLY])
+
+
+def test_calibration_sum():
+    equations = [(190, [10, 19]), (156, [15, 6]), (83, [17, 5]), (7290, [6, 8, 6, 15]), (292, [11, 6, 16, 20])]
+    reports = []
+
+    total = calibration_sum(
+        equations, [ADD, MULTIPLY, CONCATENATE], chunk_size=2, progress=lambda *args: reports.append(args)
+    )
+
+    assert total == 190 + 156 + 7290 + 292
+    assert reports[-1] == (5, 5)
+
+
+def test_calibration_sum_parallel():
+    equations = [(190, [10, 19]), (156, [15, 6]), (83, [17, 5]), (7290, [6, 8, 6, 15]), (292, [11, 6, 16, 20])] * 10
+
+    assert calibration_sum(equations, [ADD, MULTIPLY], jobs=2, chunk_size=8) == (190 + 292) * 10
@@ -0,0 +1,141 @@
+import array
+import dataclasses
+import heapq
+import math
+import typing
+
+
+NodeId = int
+Neighbors = typing.Callable[[NodeId], typing.Iterable[tuple[NodeId, int]]]
+Heuristic = typing.Callable[[NodeId], int]
+
+
+@dataclasses.dataclass
+class ShortestPaths:
+    distances: list[float]
+    predecessors: list[list[NodeId]]
+
+    def nodes_on_shortest_paths(self, targets: typing.Iterable[NodeId]) -> set[NodeId]:
+        # every predecessor lies on some shortest path, so one walk back from the targets finds them all
+        seen: set[NodeId] = set(targets)
+        stack = list(seen)
+
+        while stack:
+            for predecessor in self.predecessors[stack.pop()]:
+                if predecessor not in seen:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+
+        return seen
+
+
+def dijkstra(node_count: int, neighbors: Neighbors, sources: typing.Iterable[NodeId]) -> ShortestPaths:
+    distances: list[float] = [math.inf] * node_count
+    predecessors: list[list[NodeId]] = [[] for _ in range(node_count)]
+    settled = bytearray(node_count)
+
+    heap: list[tuple[float, NodeId]] = []
+
+    for source in sources:
+        distances[source] = 0
+        heap.append((0, source))
+
+    heapq.heapify(heap)
+
+    while heap:
+        distance, node = heapq.heappop(heap)
+
+        if settled[node]:
+            continue
+
+        settled[node] = 1
+
+        for neighbor, weight in neighbors(node):
+            neighbor_distance = distance + weight
+
+            if neighbor_distance < distances[neighbor]:
+                distances[neighbor] = neighbor_distance
+                predecessors[neighbor] = [node]
+                heapq.heappush(heap, (neighbor_distance, neighbor))
+            elif neighbor_distance == distances[neighbor]:
+                predecessors[neighbor].append(node)
+
+    return ShortestPaths(distances, predecessors)
+
+
+def astar(
+    node_count: int, neighbors: Neighbors, source: NodeId, target: NodeId, heuristic: Heuristic
+) -> list[NodeId] | None:
+    # heuristic must be consistent (h(u) <= weight + h(v) on every edge) so a popped node is final
+    g_scores = array.array("d", [math.inf]) * node_count
+    parents = array.array("q", [-1]) * node_count
+    settled = bytearray(node_count)
+
+    g_scores[source] = 0
+    heap: list[tuple[float, float, NodeId]] = [(heuristic(source), 0, source)]
+
+    while heap:
+        _, g_score, node = heapq.heappop(heap)
+
+        if settled[node]:
+            continue
+
+        if node == target:
+            path = [node]
+            while node != source:
+                node = parents[node]
+                path.append(node)
+            path.reverse()
+            return path
+
+        settled[node] = 1
+
+        for neighbor, weight in neighbors(node):
+            neighbor_g_score = g_score + weight
+
+            if neighbor_g_score < g_scores[neighbor]:
+                g_scores[neighbor] = neighbor_g_score
+                parents[neighbor] = node
+                heapq.heappush(heap, (neighbor_g_score + heuristic(neighbor), neighbor_g_score, neighbor))
+
+    return None
+
+
+@dataclasses.dataclass
+class DisjointSet:
+    __parents: list[NodeId]
+    __sizes: list[int]
+
+    def __init__(self, node_count: int):
+        self.__parents = list(range(node_count))
+        self.__sizes = [1] * node_count
+
+    def find(self, node: NodeId) -> NodeId:
+        parents = self.__parents
+
+        # path halving: every other node on the way up is re-pointed at its grandparent
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+
+        return node
+
+    def union(self, a: NodeId, b: NodeId) -> bool:
+        a = self.find(a)
+        b = self.find(b)
+
+        if a == b:
+            return False
+
+        if self.__sizes[a] < self.__sizes[b]:
+            a, b = b, a
+
+        self.__parents[b] = a
+        self.__sizes[a] += self.__sizes[b]
+        return True
+
+    def connected(self, a: NodeId, b: NodeId) -> bool:
+        return self.find(a) == self.find(b)
+
+    def size(self, node: NodeId) -> int:
+        return self.__sizes[self.find(node)]
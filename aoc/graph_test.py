@@ -0,0 +1,58 @@
+import math
+
+from aoc.graph import DisjointSet, astar, dijkstra
+
+
+EDGES = {0: [(1, 1), (2, 1)], 1: [(3, 1)], 2: [(3, 1)], 3: [(4, 5)], 4: [], 5: []}
+
+
+def test_dijkstra_distances():
+    paths = dijkstra(len(EDGES), lambda node: EDGES[node], [0])
+
+    assert paths.distances == [0, 1, 1, 2, 7, math.inf]
+
+
+def test_nodes_on_shortest_paths():
+    paths = dijkstra(len(EDGES), lambda node: EDGES[node], [0])
+
+    assert sorted(paths.predecessors[3]) == [1, 2]
+    assert paths.nodes_on_shortest_paths([3]) == {0, 1, 2, 3}
+    assert paths.nodes_on_shortest_paths([1]) == {0, 1}
+
+
+def test_astar_grid():
+    # 4x3 grid with a wall down column 1 except on the bottom row
+    width = 4
+    walls = {1, 5}
+
+    def neighbors(node):
+        x, y = node % width, node // width
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < 3 and ny * width + nx not in walls:
+                yield ny * width + nx, 1
+
+    def heuristic(node):
+        return abs(node % width - 3) + abs(node // width)
+
+    path = astar(12, neighbors, 0, 3, heuristic)
+
+    assert path is not None
+    assert len(path) == 8
+    assert path[:4] == [0, 4, 8, 9]
+    assert path[-1] == 3
+    assert astar(12, lambda node: [], 0, 3, heuristic) is None
+
+
+def test_disjoint_set():
+    sets = DisjointSet(5)
+
+    assert sets.union(0, 1)
+    assert sets.union(3, 4)
+    assert not sets.union(1, 0)
+    assert sets.connected(0, 1)
+    assert not sets.connected(1, 3)
+
+    assert sets.union(1, 4)
+    assert sets.connected(0, 3)
+    assert sets.size(3) == 4
+    assert sets.size(2) == 1
@@ -1,10 +1,16 @@
 import dataclasses
 import typing
 
+from aoc.graph import DisjointSet
+
 
 Point = tuple[int, int]
 CoordFn = typing.Callable[[int, int], Point]
 Segment = list[Point]
+Mask = int
+
+NEIGHBORS_4: tuple[Point, ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+NEIGHBORS_8: tuple[Point, ...] = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
 
 
 def move_up(y: int) -> int:
@@ -53,35 +59,58 @@ def translate_right(point: Point) -> Point:
 
 @dataclasses.dataclass
 class Grid:
-    __rows: list[str]
+    __cells: bytearray
+    __width: int
+    __height: int
+    __stride: int
+    # every real cell set, separators clear; built on first use and only depends on the grid's shape
+    __cell_mask: Mask | None
 
     def __init__(self, rows: list[str]):
-        self.__rows = rows
+        width = len(rows[0]) if rows else 0
+
+        for row in rows:
+            if len(row) != width:
+                raise ValueError(f"grid rows must all be the same length: expected {width}, got {len(row)}")
+
+        # each row is followed by a newline so a flat scan can never run from one row into the next
+        self.__cells = bytearray("".join(row + "\n" for row in rows), "latin-1")
+        self.__width = width
+        self.__height = len(rows)
+        self.__stride = width + 1
+        self.__cell_mask = None
 
     def __iter__(self):
-        for y, row in enumerate(self.__rows):
-            yield y, enumerate(row)
+        for y in range(self.__height):
+            start = y * self.__stride
+            yield y, enumerate(self.__cells[start : start + self.__width].decode("latin-1"))
 
     def copy(self) -> "Grid":
-        return Grid(self.__rows.copy())
+        grid = Grid.__new__(Grid)
+        grid.__cells = self.__cells.copy()
+        grid.__width = self.__width
+        grid.__height = self.__height
+        grid.__stride = self.__stride
+        grid.__cell_mask = self.__cell_mask
+        return grid
 
     def col_count(self) -> int:
-        return len(self.__rows[0])
+        return self.__width
 
     def row_count(self) -> int:
-        return len(self.__rows)
+        return self.__height
 
     def border_top(self) -> int:
         return 0
 
     def border_bottom(self) -> int:
-        return len(self.__rows) - 1
+        return self.__height - 1
 
     def border_left(self) -> int:
         return 0
 
     def border_right(self) -> int:
-        return len(self.__rows[0]) - 1
+        return self.__width - 1
 
     def corner_upper_right(self) -> Point:
         return self.border_right(), self.border_top()
@@ -96,16 +125,167 @@ class Grid:
         return self.border_left(), self.border_bottom()
 
     def get(self, xy: Point) -> str:
-        return self.__rows[xy[1]][xy[0]]
+        return chr(self.__cells[self.__offset(xy)])
 
     def setchar(self, xy: Point, char: str) -> None:
-        line = list(self.__rows[xy[1]])
-        line[xy[0]] = char
-        self.__rows[xy[1]] = "".join(line)
+        self.__cells[self.__offset(xy)] = ord(char)
 
     def is_in_bounds(self, xy: Point) -> bool:
         x, y = xy
-        return self.border_left() <= x <= self.border_right() and self.border_top() <= y <= self.border_bottom()
+        return 0 <= x < self.__width and 0 <= y < self.__height
+
+    def view(self) -> memoryview:
+        # zero-copy uint8 view shaped (rows, cols + 1); the last column of every row is the newline separator
+        if self.__height == 0:
+            # memoryview cannot cast to a shape with a zero in it, so an empty grid gets a flat empty view
+            return memoryview(self.__cells)
+
+        return memoryview(self.__cells).cast("B", (self.__height, self.__stride))
+
+    def mask(self, predicate: typing.Callable[[str], bool]) -> Mask:
+        # bitset of the cells where predicate holds; each cell owns the 8 bits at 8 * its flat offset
+        table = bytes(1 if b != 10 and predicate(chr(b)) else 0 for b in range(256))
+        return int.from_bytes(self.__cells.translate(table), "little")
+
+    def mask_of(self, chars: str) -> Mask:
+        return self.mask(lambda char: char in chars)
+
+    def points(self, mask: Mask) -> list[Point]:
+        lanes = mask.to_bytes(len(self.__cells), "little")
+        result: list[Point] = []
+
+        offset = lanes.find(1)
+        while offset >= 0:
+            y, x = divmod(offset, self.__stride)
+            result.append((x, y))
+            offset = lanes.find(1, offset + 1)
+
+        return result
+
+    def where(self, predicate: typing.Callable[[str], bool]) -> list[Point]:
+        return self.points(self.mask(predicate))
+
+    def shift_mask(self, mask: Mask, dx: int, dy: int) -> Mask:
+        # bitset of the cells whose neighbor at (x + dx, y + dy) is set in mask
+        if not (-1 <= dx <= 1):
+            raise ValueError(f"horizontal shift must be between -1 and 1: {dx}")
+
+        bits = 8 * (dy * self.__stride + dx)
+        shifted = mask >> bits if bits >= 0 else mask << -bits
+
+        if self.__cell_mask is None:
+            self.__cell_mask = int.from_bytes((b"\x01" * self.__width + b"\x00") * self.__height, "little")
+
+        return shifted & self.__cell_mask
+
+    def neighbor_masks_4(self, mask: Mask) -> list[Mask]:
+        return [self.shift_mask(mask, dx, dy) for dx, dy in NEIGHBORS_4]
+
+    def neighbor_masks_8(self, mask: Mask) -> list[Mask]:
+        return [self.shift_mask(mask, dx, dy) for dx, dy in NEIGHBORS_8]
+
+    def row_counts(self, char: str) -> list[int]:
+        b = ord(char)
+        return [
+            self.__cells.count(b, y * self.__stride, y * self.__stride + self.__width) for y in range(self.__height)
+        ]
+
+    def col_counts(self, char: str) -> list[int]:
+        b = ord(char)
+        return [self.__cells[x :: self.__stride].count(b) for x in range(self.__width)]
+
+    def diagonal_counts(self, char: str) -> list[int]:
+        # counts along the lines where x - y is constant, starting from the lower left corner
+        b = ord(char)
+        step = self.__stride + 1
+        result: list[int] = []
+
+        for k in range(-self.border_bottom(), self.__width):
+            x, y = max(k, 0), max(-k, 0)
+            length = min(self.__width - x, self.__height - y)
+            start = y * self.__stride + x
+            result.append(self.__cells[start : start + (length - 1) * step + 1 : step].count(b))
+
+        return result
+
+    def antidiagonal_counts(self, char: str) -> list[int]:
+        # counts along the lines where x + y is constant, starting from the upper left corner
+        b = ord(char)
+        step = self.__stride - 1
+        result: list[int] = []
+
+        for k in range(self.__width + self.__height - 1):
+            x, y = min(k, self.border_right()), k - min(k, self.border_right())
+            length = min(x + 1, self.__height - y)
+            start = y * self.__stride + x
+            result.append(self.__cells[start : start + (length - 1) * step + 1 : step].count(b))
+
+        return result
+
+    def find_word(self, word: str, directions: typing.Iterable[Point] = NEIGHBORS_8) -> dict[Point, list[Point]]:
+        # start positions of every occurrence of word, keyed by the direction it reads in
+        return {direction: self.points(mask) for direction, mask in self.__word_masks(word, directions).items()}
+
+    def count_word(self, word: str, directions: typing.Iterable[Point] = NEIGHBORS_8) -> int:
+        return sum(mask.bit_count() for mask in self.__word_masks(word, directions).values())
+
+    def label_regions(self) -> tuple[list[int], int]:
+        # connected areas of equal characters; labels are indexed y * width + x and numbered 0.. in row major order
+        # of each region's first cell
+        cells = self.__cells
+        stride = self.__stride
+        sets = DisjointSet(len(cells))
+
+        # the separator column never matches a real cell, so joining right and down neighbours cannot wrap rows
+        for offset in range(len(cells) - 1):
+            if cells[offset] == cells[offset + 1]:
+                sets.union(offset, offset + 1)
+            if offset + stride < len(cells) and cells[offset] == cells[offset + stride]:
+                sets.union(offset, offset + stride)
+
+        labels: list[int] = []
+        numbering: dict[int, int] = {}
+
+        for y in range(self.__height):
+            for offset in range(y * stride, y * stride + self.__width):
+                labels.append(numbering.setdefault(sets.find(offset), len(numbering)))
+
+        return labels, len(numbering)
+
+    def __word_masks(self, word: str, directions: typing.Iterable[Point]) -> dict[Point, Mask]:
+        if len(word) == 0:
+            raise ValueError("word cannot be empty")
+
+        char_masks = {char: self.mask_of(char) for char in set(word)}
+        result: dict[Point, Mask] = {}
+
+        for dx, dy in directions:
+            if not (-1 <= dx <= 1):
+                raise ValueError(f"horizontal step must be between -1 and 1: {dx}")
+
+            step = dy * self.__stride + dx
+            mask = char_masks[word[0]]
+
+            # keep the starts whose k-th cell along the direction holds word[k]
+            for k in range(1, len(word)):
+                if mask == 0:
+                    break
+
+                bits = 8 * k * step
+                char_mask = char_masks[word[k]]
+                mask &= char_mask >> bits if bits >= 0 else char_mask << -bits
+
+            result[(dx, dy)] = mask
+
+        return result
+
+    def __offset(self, xy: Point) -> int:
+        x, y = xy
+
+        if not (0 <= x < self.__width and 0 <= y < self.__height):
+            raise IndexError(f"grid coordinate out of range: {xy}")
+
+        return y * self.__stride + x
 
 
 @dataclasses.dataclass
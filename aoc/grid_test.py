@@ -1,3 +1,5 @@
+import pytest
+
 from aoc import grid as g
 
 GRID = g.Grid(["...", "...", "..."])
@@ -64,3 +66,140 @@ def test_diagonal_ur_bl_search():
 def test_diagonal_br_ul_search():
     trace = _trace_search(g.GridSearch.diagonal_br_ul_search(GRID))
     assert trace == ["02", "12", "01", "22", "11", "00", "21", "10", "20"]
+
+
+def test_get_and_setchar():
+    grid = g.Grid(["ab", "cd"])
+
+    assert grid.get((0, 0)) == "a"
+    assert grid.get((1, 1)) == "d"
+
+    grid.setchar((1, 0), "#")
+
+    assert grid.get((1, 0)) == "#"
+    assert [(y, "".join(c for _, c in row)) for y, row in grid] == [(0, "a#"), (1, "cd")]
+
+
+def test_get_out_of_bounds():
+    grid = g.Grid(["ab", "cd"])
+
+    with pytest.raises(IndexError):
+        grid.get((2, 0))
+
+    with pytest.raises(IndexError):
+        grid.get((0, -1))
+
+
+def test_copy_is_independent():
+    grid = g.Grid(["ab", "cd"])
+    other = grid.copy()
+
+    other.setchar((0, 0), "#")
+
+    assert grid.get((0, 0)) == "a"
+    assert other.get((0, 0)) == "#"
+
+
+def test_rows_must_be_the_same_length():
+    with pytest.raises(ValueError):
+        g.Grid(["abc", "d"])
+
+
+def test_view_is_zero_copy():
+    grid = g.Grid(["ab", "cd"])
+    view = grid.view()
+
+    assert view.shape == (2, 3)
+    assert view[1, 0] == ord("c")
+
+    view[1, 0] = ord("#")
+
+    assert grid.get((0, 1)) == "#"
+
+
+def test_empty_grid_view():
+    view = g.Grid([]).view()
+
+    assert len(view) == 0
+
+
+def test_where():
+    grid = g.Grid(["a.b", ".a.", "b.a"])
+
+    assert grid.where(lambda char: char == "a") == [(0, 0), (1, 1), (2, 2)]
+    assert grid.points(grid.mask_of("b")) == [(2, 0), (0, 2)]
+
+
+def test_neighbor_masks():
+    grid = g.Grid(["...", ".#.", "..."])
+    up, right, down, left = grid.neighbor_masks_4(grid.mask_of("#"))
+
+    assert grid.points(up) == [(1, 2)]
+    assert grid.points(right) == [(0, 1)]
+    assert grid.points(down) == [(1, 0)]
+    assert grid.points(left) == [(2, 1)]
+
+    neighbors = 0
+    for mask in grid.neighbor_masks_8(grid.mask_of("#")):
+        neighbors |= mask
+
+    assert grid.points(neighbors) == [(0, 0), (1, 0), (2, 0), (0, 1), (2, 1), (0, 2), (1, 2), (2, 2)]
+
+
+def test_neighbor_masks_after_setchar():
+    grid = g.Grid(["...", "...", "..."])
+    grid.neighbor_masks_4(grid.mask_of("#"))
+    grid.setchar((1, 1), "#")
+    copy = grid.copy()
+
+    for source in (grid, copy):
+        neighbors = 0
+        for mask in source.neighbor_masks_4(source.mask_of("#")):
+            neighbors |= mask
+
+        assert source.points(neighbors) == [(1, 0), (0, 1), (2, 1), (1, 2)]
+
+
+def test_neighbor_masks_do_not_wrap():
+    grid = g.Grid(["#..", "..#"])
+    _, right, _, left = grid.neighbor_masks_4(grid.mask_of("#"))
+
+    assert grid.points(right) == [(1, 1)]
+    assert grid.points(left) == [(1, 0)]
+
+
+def test_line_counts():
+    grid = g.Grid(["x..", "xx.", "..x"])
+
+    assert grid.row_counts("x") == [1, 2, 1]
+    assert grid.col_counts("x") == [2, 1, 1]
+    assert grid.diagonal_counts("x") == [0, 1, 3, 0, 0]
+    assert grid.antidiagonal_counts("x") == [1, 1, 1, 0, 1]
+
+
+def test_find_word():
+    grid = g.Grid(["XMAS", "MM..", "A.A.", "S..S"])
+
+    assert grid.find_word("XMAS", [(1, 0), (0, 1), (1, 1), (-1, 0)]) == {
+        (1, 0): [(0, 0)],
+        (0, 1): [(0, 0)],
+        (1, 1): [(0, 0)],
+        (-1, 0): [],
+    }
+    assert grid.count_word("XMAS") == 3
+    assert grid.count_word("SAMX") == 3
+
+
+def test_find_word_does_not_wrap():
+    grid = g.Grid(["..X", "MAS"])
+
+    assert grid.count_word("XMAS") == 0
+
+
+def test_label_regions():
+    grid = g.Grid(["AAB", "BAB", "BBA"])
+
+    labels, count = grid.label_regions()
+
+    assert count == 4
+    assert labels == [0, 0, 1, 2, 0, 1, 2, 2, 3]
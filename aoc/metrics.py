@@ -0,0 +1,91 @@
+import contextlib
+import dataclasses
+import resource
+import sys
+import time
+import tracemalloc
+import typing
+
+
+@dataclasses.dataclass
+class PhaseMetrics:
+    name: str
+    wall_time: float
+    cpu_time: float
+    peak_rss: int
+    traced_peak: int | None
+
+
+@dataclasses.dataclass
+class _RunningPhase:
+    traced_peak: int = 0
+
+
+_running: list[_RunningPhase] = []
+_recorded: list[PhaseMetrics] = []
+
+
+def peak_rss() -> int:
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # linux reports kilobytes, macos reports bytes
+    return usage if sys.platform == "darwin" else usage * 1024
+
+
+@contextlib.contextmanager
+def phase(name: str) -> typing.Generator[None, None, None]:
+    tracing = tracemalloc.is_tracing()
+
+    if tracing:
+        # fold the enclosing phase's peak so far into it before the counter is reset for this phase
+        if _running:
+            _running[-1].traced_peak = max(_running[-1].traced_peak, tracemalloc.get_traced_memory()[1])
+
+        tracemalloc.reset_peak()
+
+    running = _RunningPhase()
+    _running.append(running)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    try:
+        yield
+    finally:
+        wall_time = time.perf_counter() - wall_start
+        cpu_time = time.process_time() - cpu_start
+
+        _running.pop()
+
+        traced_peak = None
+
+        if tracing:
+            traced_peak = max(running.traced_peak, tracemalloc.get_traced_memory()[1])
+
+            if _running:
+                _running[-1].traced_peak = max(_running[-1].traced_peak, traced_peak)
+
+        _recorded.append(PhaseMetrics(name, wall_time, cpu_time, peak_rss(), traced_peak))
+
+
+def recorded_phases() -> list[PhaseMetrics]:
+    return list(_recorded)
+
+
+def reset() -> None:
+    _running.clear()
+    _recorded.clear()
+
+
+def format_bytes(size: int | None) -> str:
+    if size is None:
+        return "n/a"
+
+    return f"{size / (1024 * 1024):.1f}MiB"
+
+
+def format_phase(metrics: PhaseMetrics) -> str:
+    return (
+        f"phase {metrics.name}: wall={metrics.wall_time:.3f}s cpu={metrics.cpu_time:.3f}s"
+        f" peak_rss={format_bytes(metrics.peak_rss)} traced_peak={format_bytes(metrics.traced_peak)}"
+    )
@@ -0,0 +1,32 @@
+import tracemalloc
+
+from aoc import metrics
+
+
+def test_phases_are_recorded_innermost_first():
+    metrics.reset()
+
+    with metrics.phase("solve"):
+        with metrics.phase("parse"):
+            pass
+
+    assert [m.name for m in metrics.recorded_phases()] == ["parse", "solve"]
+    assert all(m.traced_peak is None for m in metrics.recorded_phases())
+
+
+def test_traced_peak_includes_nested_phases():
+    metrics.reset()
+    tracemalloc.start()
+
+    try:
+        with metrics.phase("solve"):
+            with metrics.phase("parse"):
+                data = bytearray(4 * 1024 * 1024)
+                del data
+    finally:
+        tracemalloc.stop()
+
+    parse, solve = metrics.recorded_phases()
+
+    assert parse.traced_peak is not None and parse.traced_peak >= 4 * 1024 * 1024
+    assert solve.traced_peak is not None and solve.traced_peak >= parse.traced_peak
@@ -0,0 +1,116 @@
+import cProfile
+import io
+import logging
+import pathlib
+import pstats
+import sys
+import threading
+import time
+import types
+import typing
+
+
+T = typing.TypeVar("T")
+
+
+def run_cprofile(fn: typing.Callable[[], T], output_path: pathlib.Path, top: int) -> T:
+    profiler = cProfile.Profile()
+
+    try:
+        return profiler.runcall(fn)
+    finally:
+        profiler.dump_stats(output_path)
+
+        table = io.StringIO()
+        pstats.Stats(profiler, stream=table).sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+        logging.info(f"wrote cProfile stats to {output_path}\n{table.getvalue()}")
+
+
+def code_label(code: types.CodeType) -> str:
+    path = pathlib.Path(code.co_filename)
+
+    try:
+        path = path.relative_to(pathlib.Path.cwd())
+    except ValueError:
+        path = pathlib.Path(path.name)
+
+    return f"{path}:{code.co_name}"
+
+
+class SamplingProfiler:
+    # samples the stack of a single thread from a background thread; the target thread is never instrumented
+    interval: float
+    samples: dict[str, int]
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples = {}
+        self.__labels: dict[types.CodeType, str] = {}
+        self.__target_thread_id = threading.get_ident()
+        self.__stopped = threading.Event()
+        self.__thread = threading.Thread(target=self.__sample_loop, name="sampling-profiler", daemon=True)
+
+    def start(self) -> None:
+        self.__target_thread_id = threading.get_ident()
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__stopped.set()
+        self.__thread.join()
+
+    def __sample_loop(self) -> None:
+        while not self.__stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.__target_thread_id)
+
+            stack: list[str] = []
+
+            while frame is not None:
+                code = frame.f_code
+
+                if code not in self.__labels:
+                    self.__labels[code] = code_label(code)
+
+                stack.append(self.__labels[code])
+                frame = frame.f_back
+
+            if stack:
+                key = ";".join(reversed(stack))
+                self.samples[key] = self.samples.get(key, 0) + 1
+
+    def write_collapsed(self, output_path: pathlib.Path) -> None:
+        with output_path.open("w") as fp:
+            for stack, count in sorted(self.samples.items()):
+                fp.write(f"{stack} {count}\n")
+
+    def top_table(self, top: int) -> str:
+        total = sum(self.samples.values())
+        self_samples: dict[str, int] = {}
+
+        for stack, count in self.samples.items():
+            leaf = stack.rsplit(";", 1)[-1]
+            self_samples[leaf] = self_samples.get(leaf, 0) + count
+
+        lines = [f"{total} samples", f"{'samples':>8} {'self%':>6}  function"]
+
+        for leaf, count in sorted(self_samples.items(), key=lambda item: item[1], reverse=True)[:top]:
+            lines.append(f"{count:>8} {count / total:>6.1%}  {leaf}")
+
+        return "\n".join(lines)
+
+
+def run_sampling(fn: typing.Callable[[], T], output_path: pathlib.Path, top: int, interval: float = 0.001) -> T:
+    profiler = SamplingProfiler(interval)
+    profiler.start()
+
+    start = time.perf_counter()
+
+    try:
+        return fn()
+    finally:
+        profiler.stop()
+        profiler.write_collapsed(output_path)
+
+        logging.info(
+            f"wrote {time.perf_counter() - start:.3f}s of collapsed stacks to {output_path}\n{profiler.top_table(top)}"
+        )
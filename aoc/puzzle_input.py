@@ -1,7 +1,14 @@
+import array
+import dataclasses
+import mmap
 import pathlib
+import re
 import typing
 
 
+_int_pattern = re.compile(rb"-?\d+")
+
+
 def read_input_lines(file_path: pathlib.Path) -> typing.Generator[str, None, None]:
     with file_path.open("r") as fp:
         for line in fp:
@@ -20,3 +27,109 @@ def read_input_lines_v2(file_path: pathlib.Path) -> typing.Generator[str, None,
 def read_input(file_path: pathlib.Path) -> str:
     with file_path.open("r") as fp:
         return fp.read()
+
+
+def _map_file(file_path: pathlib.Path) -> mmap.mmap | bytes:
+    with file_path.open("rb") as fp:
+        # mmap refuses empty files
+        if file_path.stat().st_size == 0:
+            return b""
+
+        # the mapping outlives the file handle and is unmapped once the last view onto it is released
+        return mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def mmap_input(file_path: pathlib.Path) -> memoryview:
+    return memoryview(_map_file(file_path))
+
+
+def read_input_bytes(file_path: pathlib.Path) -> typing.Generator[memoryview, None, None]:
+    # zero-copy line slices without their trailing newline; blank lines are kept
+    data = _map_file(file_path)
+    view = memoryview(data)
+    size = len(data)
+    start = 0
+
+    while start < size:
+        end = data.find(b"\n", start)
+
+        if end < 0:
+            end = size
+
+        yield view[start:end]
+
+        start = end + 1
+
+
+def read_input_ints(file_path: pathlib.Path) -> typing.Generator[list[int], None, None]:
+    for line in read_input_bytes(file_path):
+        values = list(map(int, _int_pattern.findall(line)))
+
+        if len(values) > 0:
+            yield values
+
+
+def read_int_columns(file_path: pathlib.Path, column_count: int) -> list[list[int]]:
+    values = list(map(int, _int_pattern.findall(_map_file(file_path))))
+
+    if len(values) % column_count != 0:
+        raise ValueError(f"found {len(values)} integers which do not fill {column_count} columns")
+
+    return [values[i::column_count] for i in range(column_count)]
+
+
+@dataclasses.dataclass
+class IntMatrix:
+    # row i is values[offsets[i] : offsets[i + 1]]; both arrays expose the buffer protocol for zero-copy wrapping
+    values: array.array
+    offsets: array.array
+    # length shared by every row, checked once while reading; None when the rows are ragged
+    width: int | None
+
+    def row_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def col_count(self) -> int:
+        if self.width is None:
+            raise ValueError("matrix rows are ragged")
+
+        return self.width
+
+    def row(self, i: int) -> array.array:
+        return self.values[self.offsets[i] : self.offsets[i + 1]]
+
+    def column(self, j: int) -> array.array:
+        width = self.col_count()
+
+        if not (0 <= j < width):
+            raise IndexError(f"column out of range: {j}")
+
+        return self.values[j::width]
+
+
+def read_int_matrix(file_path: pathlib.Path, sep: str | None = None, ragged: bool = False) -> IntMatrix:
+    separator = sep.encode() if sep is not None else None
+
+    values = array.array("q")
+    offsets = array.array("q", [0])
+    width: int | None = 0
+
+    for line in file_path.read_bytes().splitlines():
+        if len(line.strip()) == 0:
+            continue
+
+        values.extend(map(int, line.split(separator)))
+        offsets.append(len(values))
+
+        row_width = offsets[-1] - offsets[-2]
+        if len(offsets) == 2:
+            width = row_width
+        elif row_width != width:
+            width = None
+
+    matrix = IntMatrix(values, offsets, width)
+
+    if not ragged:
+        matrix.col_count()
+
+    return matrix
@@ -0,0 +1,73 @@
+import pathlib
+
+import pytest
+
+from aoc.puzzle_input import mmap_input, read_input_bytes, read_input_ints, read_int_columns, read_int_matrix
+
+
+def test_read_input_bytes(tmp_path: pathlib.Path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"ab\n\ncd")
+
+    assert [bytes(line) for line in read_input_bytes(input_file)] == [b"ab", b"", b"cd"]
+
+
+def test_mmap_input_empty_file(tmp_path: pathlib.Path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"")
+
+    assert len(mmap_input(input_file)) == 0
+    assert list(read_input_bytes(input_file)) == []
+
+
+def test_read_input_ints(tmp_path: pathlib.Path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"190: 10 19\n\np=0,4 v=3,-3\n")
+
+    assert list(read_input_ints(input_file)) == [[190, 10, 19], [0, 4, 3, -3]]
+
+
+def test_read_int_columns(tmp_path: pathlib.Path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"3   4\n4   3\n2   5\n")
+
+    assert read_int_columns(input_file, 2) == [[3, 4, 2], [4, 3, 5]]
+
+    with pytest.raises(ValueError):
+        read_int_columns(input_file, 4)
+
+
+def test_read_int_matrix(tmp_path: pathlib.Path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"5,4\n4,2\n\n-4,5\n")
+
+    matrix = read_int_matrix(input_file, sep=",")
+
+    assert matrix.row_count() == 3
+    assert matrix.col_count() == 2
+    assert matrix.width == 2
+    assert list(matrix.row(2)) == [-4, 5]
+    assert list(matrix.column(0)) == [5, 4, -4]
+
+
+def test_read_int_matrix_ragged(tmp_path: pathlib.Path):
+    input_file = tmp_path / "input.txt"
+    input_file.write_bytes(b"7 6 4\n1 2\n")
+
+    with pytest.raises(ValueError):
+        read_int_matrix(input_file)
+
+    matrix = read_int_matrix(input_file, ragged=True)
+
+    assert list(matrix.offsets) == [0, 3, 5]
+    assert list(matrix.row(1)) == [1, 2]
+    assert matrix.width is None
+
+    with pytest.raises(ValueError):
+        matrix.column(0)
+
+    # same total as a 3x2 matrix, but the rows are still uneven
+    input_file.write_bytes(b"1 2\n3\n4 5 6\n")
+
+    with pytest.raises(ValueError):
+        read_int_matrix(input_file)
@@ -0,0 +1,142 @@
+import argparse
+import concurrent.futures
+import dataclasses
+import json
+import logging
+import os
+import pathlib
+import signal
+import sys
+import time
+
+from aoc.bench import quiet_run
+from aoc.discover import Solution, discover_solutions
+
+
+@dataclasses.dataclass
+class RunResult:
+    solution: str
+    status: str
+    answer: str
+    wall_time: float
+    cpu_time: float
+    error: str = ""
+
+
+def _raise_timeout(signum, frame):
+    raise TimeoutError("solver timed out")
+
+
+def run_solution(root: pathlib.Path, solution: Solution, input_file: pathlib.Path, timeout: float) -> RunResult:
+    # runs in a pool worker; the alarm interrupts the solver itself rather than abandoning a busy worker
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+
+    signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    try:
+        answer = quiet_run(solution.load(), input_file)
+        status, error = "ok", ""
+    except TimeoutError:
+        answer, status, error = "", "timeout", f"exceeded {timeout}s"
+    except Exception as e:
+        answer, status, error = "", "error", repr(e)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return RunResult(
+        solution.name, status, answer, time.perf_counter() - wall_start, time.process_time() - cpu_start, error
+    )
+
+
+def run(root: pathlib.Path, solutions: list[Solution], inputs: str, jobs: int, timeout: float) -> list[RunResult]:
+    results: list[RunResult] = []
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures: dict[concurrent.futures.Future, Solution] = {}
+
+        for solution in solutions:
+            input_file = pathlib.Path(inputs.format(day=solution.day))
+
+            if not input_file.is_absolute():
+                input_file = root.joinpath(input_file)
+
+            if not input_file.exists():
+                results.append(RunResult(solution.name, "skipped", "", 0.0, 0.0, f"no input at {input_file}"))
+                continue
+
+            futures[executor.submit(run_solution, root, solution, input_file, timeout)] = solution
+
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = RunResult(futures[future].name, "error", "", 0.0, 0.0, repr(e))
+
+            logging.info(f"{result.solution}: {result.status} in {result.wall_time:.3f}s")
+
+            results.append(result)
+
+    order = {solution.name: i for i, solution in enumerate(solutions)}
+    results.sort(key=lambda r: order[r.solution])
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m aoc.runner")
+    parser.add_argument("--root", type=pathlib.Path, default=pathlib.Path.cwd())
+    parser.add_argument("--inputs", default="data/{day}.txt", help="input path pattern, {day} becomes e.g. d7")
+    parser.add_argument("--days", nargs="*", help="only these days, e.g. d1 d7")
+    parser.add_argument("--parts", nargs="*", choices=["a", "b"], default=["a", "b"])
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count())
+    parser.add_argument("--timeout", type=float, default=300.0, help="seconds allowed per solver")
+    parser.add_argument("--report", type=pathlib.Path, help="write the results as json")
+    parser.add_argument("--debug", "-d", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        format="%(asctime)s %(levelname).2s: %(message)s",
+        datefmt="%I:%M:%S %p",
+        level=logging.INFO if args.debug else logging.WARNING,
+    )
+
+    root = args.root.resolve()
+    sys.path.insert(0, str(root))
+
+    solutions = [s for s in discover_solutions(root, args.days) if s.part in args.parts]
+
+    start = time.perf_counter()
+    results = run(root, solutions, args.inputs, args.jobs, args.timeout)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'solution':<10} {'status':<8} {'wall':>9} {'cpu':>9}  answer")
+
+    for result in results:
+        print(
+            f"{result.solution:<10} {result.status:<8} {result.wall_time:>8.3f}s {result.cpu_time:>8.3f}s"
+            f"  {result.answer or result.error}"
+        )
+
+    serial_time = sum(result.wall_time for result in results)
+
+    print(f"{len(results)} solvers in {elapsed:.3f}s ({serial_time:.3f}s of solver time, {args.jobs} jobs)")
+
+    if args.report is not None:
+        record = {
+            "elapsed": elapsed,
+            "jobs": args.jobs,
+            "results": [dataclasses.asdict(result) for result in results],
+        }
+        args.report.write_text(json.dumps(record, indent=2) + "\n")
+
+    if any(result.status in ("error", "timeout") for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,41 @@
 import argparse
+import dataclasses
+import inspect
+import json
 import logging
 import pathlib
 import sys
+import tracemalloc
 import typing
 
+from aoc import metrics, profiling
+from aoc.cache import ResultCache
+
 
 SolveFn = typing.Callable[[pathlib.Path], str]
 
 
+def run_solve_fn(solve_fn: SolveFn, input_file_path: pathlib.Path, args: argparse.Namespace, name: str) -> str:
+    if args.trace_memory:
+        tracemalloc.start()
+
+    try:
+        # the solve phase covers the whole solve_fn call, including any parse phase marked inside it
+        with metrics.phase("solve"):
+            match args.profile_mode if args.profile else None:
+                case "cprofile":
+                    output = args.profile_output or pathlib.Path.cwd().joinpath(f"{name}.pstats")
+                    return profiling.run_cprofile(lambda: solve_fn(input_file_path), output, args.profile_top)
+                case "sample":
+                    output = args.profile_output or pathlib.Path.cwd().joinpath(f"{name}.collapsed")
+                    return profiling.run_sampling(lambda: solve_fn(input_file_path), output, args.profile_top)
+                case _:
+                    return solve_fn(input_file_path)
+    finally:
+        if args.trace_memory:
+            tracemalloc.stop()
+
+
 def solver(solve_fn: SolveFn):
     cwd = pathlib.Path.cwd()
 
@@ -19,6 +47,20 @@ def solver(solve_fn: SolveFn):
     parser = argparse.ArgumentParser()
     parser.add_argument("input_file")
     parser.add_argument("--debug", "-d", action="store_true")
+    parser.add_argument("--metrics", type=pathlib.Path, help="write per-phase timing and memory as json")
+    parser.add_argument("--trace-memory", action="store_true", help="record tracemalloc peaks (slows the solver)")
+    parser.add_argument("--profile", action="store_true", help="profile the solve call, see --profile-mode")
+    parser.add_argument(
+        "--profile-mode",
+        choices=["cprofile", "sample"],
+        default="cprofile",
+        help="cprofile for exact call counts, sample for a low-overhead stack sampler",
+    )
+    parser.add_argument("--profile-output", type=pathlib.Path, help="defaults to <day>_<solution>.pstats/.collapsed")
+    parser.add_argument("--profile-top", type=int, default=20, help="rows in the hot function table")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the result cache")
+    parser.add_argument("--refresh", action="store_true", help="recompute and overwrite the cached result")
+    parser.add_argument("--cache-size", type=int, default=16 * 1024 * 1024, help="cache size limit in bytes")
     args = parser.parse_args()
 
     input_file_path = pathlib.Path(args.input_file)
@@ -38,6 +80,44 @@ def solver(solve_fn: SolveFn):
     logging.info(f"executing solver: {day_name=} {solution_name=}")
     logging.info(f"input_file: {input_file_path.relative_to(cwd)}")
 
-    answer = solve_fn(input_file_path)
+    cache = None
+    cache_key = ""
+    answer = None
+
+    if not args.no_cache:
+        cache = ResultCache(cwd.joinpath(".aoc_cache"), args.cache_size)
+        cache_key = cache.key(input_file_path, pathlib.Path(inspect.getsourcefile(solve_fn) or script_path))
+
+        # a profiling run is pointless if the answer comes from the cache
+        if not args.refresh and not args.profile:
+            answer = cache.get(cache_key)
+
+    cached = answer is not None
+
+    if answer is not None:
+        logging.info("result (cached): " + answer)
+    else:
+        answer = run_solve_fn(solve_fn, input_file_path, args, f"{day_name}_{solution_name}")
+
+        logging.info("result: " + answer)
+
+        if cache is not None:
+            cache.put(cache_key, answer, day=day_name, solution=solution_name, input_file=str(input_file_path))
+
+    phases = metrics.recorded_phases()
+
+    for phase_metrics in phases:
+        logging.info(metrics.format_phase(phase_metrics))
+
+    if args.metrics is not None:
+        record = {
+            "day": day_name,
+            "solution": solution_name,
+            "input_file": str(input_file_path),
+            "result": answer,
+            "cached": cached,
+            "phases": [dataclasses.asdict(phase_metrics) for phase_metrics in phases],
+        }
 
-    logging.info("result: " + answer)
+        with args.metrics.open("w") as fp:
+            json.dump(record, fp, indent=2)
@@ -0,0 +1,57 @@
+import collections
+import dataclasses
+import typing
+
+
+@dataclasses.dataclass
+class StepStats:
+    step: int
+    stones: int
+    distinct: int
+
+
+@dataclasses.dataclass
+class StoneEngine:
+    # stone -> the stones it becomes after one blink; kept across runs because the same few thousand values recur
+    transitions: dict[int, tuple[int, ...]] = dataclasses.field(default_factory=dict)
+
+    def children(self, stone: int) -> tuple[int, ...]:
+        children = self.transitions.get(stone)
+
+        if children is None:
+            if stone == 0:
+                children = (1,)
+            else:
+                digits = len(str(stone))
+
+                if digits % 2 == 0:
+                    children = divmod(stone, 10 ** (digits // 2))
+                else:
+                    children = (stone * 2024,)
+
+            self.transitions[stone] = children
+
+        return children
+
+    def blink(self, counts: collections.Counter[int]) -> collections.Counter[int]:
+        next_counts: collections.Counter[int] = collections.Counter()
+
+        for stone, count in counts.items():
+            for child in self.children(stone):
+                next_counts[child] += count
+
+        return next_counts
+
+    def run(
+        self, stones: typing.Iterable[int], blinks: int, stats: list[StepStats] | None = None
+    ) -> collections.Counter[int]:
+        # stones are independent and order never matters, so only the count per value is tracked
+        counts = collections.Counter(stones)
+
+        for step in range(1, blinks + 1):
+            counts = self.blink(counts)
+
+            if stats is not None:
+                stats.append(StepStats(step, counts.total(), len(counts)))
+
+        return counts
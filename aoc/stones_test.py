@@ -0,0 +1,29 @@
+from aoc.stones import StepStats, StoneEngine
+
+
+def test_children():
+    engine = StoneEngine()
+
+    assert engine.children(0) == (1,)
+    assert engine.children(1000) == (10, 0)
+    assert engine.children(99) == (9, 9)
+    assert engine.children(1) == (2024,)
+    assert engine.transitions[1000] == (10, 0)
+
+
+def test_run():
+    engine = StoneEngine()
+    stats: list[StepStats] = []
+
+    assert engine.run([125, 17], 6, stats).total() == 22
+    assert engine.run([125, 17], 25).total() == 55312
+    assert stats[0] == StepStats(1, 3, 3)
+    assert [s.stones for s in stats] == [3, 4, 5, 9, 13, 22]
+
+
+def test_distinct_stones_stay_bounded():
+    stats: list[StepStats] = []
+
+    StoneEngine().run([125, 17], 500, stats)
+
+    assert max(s.distinct for s in stats) < 4000
@@ -1,14 +1,18 @@
 import logging
 import pathlib
 
+from aoc.metrics import phase
 from aoc.puzzle_input import read_input_lines_v2
 from aoc.solver import solver
 
 
 def solve(input_file: pathlib.Path) -> str:
+    with phase("parse"):
+        lines = list(read_input_lines_v2(input_file))
+
     result: int = 0
 
-    for line in read_input_lines_v2(input_file):
+    for line in lines:
         line_length = len(line)
 
         logging.debug(f"length of line: {line_length}")
@@ -1,24 +1,13 @@
 import pathlib
 
-from aoc.puzzle_input import read_input_lines
+from aoc.metrics import phase
+from aoc.puzzle_input import read_int_columns
 from aoc.solver import solver
 
 
-def split_lr(line: str) -> tuple[int, int]:
-    left, right = line.strip().split(maxsplit=2)
-
-    return int(left), int(right)
-
-
 def solve(input_file: pathlib.Path) -> str:
-    location_ids_a = []
-    location_ids_b = []
-
-    for ln, rn in map(split_lr, read_input_lines(input_file)):
-        location_ids_a.append(ln)
-        location_ids_b.append(rn)
-
-    assert len(location_ids_a) == len(location_ids_b), "the length of the lists do not match"
+    with phase("parse"):
+        location_ids_a, location_ids_b = read_int_columns(input_file, 2)
 
     location_ids_a.sort()
     location_ids_b.sort()
@@ -1,21 +1,17 @@
 import pathlib
 
-from aoc.puzzle_input import read_input_lines
+from aoc.metrics import phase
+from aoc.puzzle_input import read_int_columns
 from aoc.solver import solver
 
 
-def split_lr(line: str) -> tuple[int, int]:
-    left, right = line.strip().split(maxsplit=2)
-
-    return int(left), int(right)
-
-
 def solve(input_file: pathlib.Path) -> str:
-    location_ids = []
+    with phase("parse"):
+        location_ids, right_location_ids = read_int_columns(input_file, 2)
+
     occurrences = {}
 
-    for ln, rn in map(split_lr, read_input_lines(input_file)):
-        location_ids.append(ln)
+    for rn in right_location_ids:
         occurrences.setdefault(rn, 0)
         occurrences[rn] += 1
 
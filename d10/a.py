@@ -6,75 +6,62 @@ from aoc.puzzle_input import read_input_lines_v2
 from aoc.solver import solver
 
 
-def move_up(p: g.Point):
-    return p[0], g.move_up(p[1])
+def cells_by_elevation(cells: bytes) -> list[list[int]]:
+    layers: list[list[int]] = [[] for _ in range(10)]
 
+    for offset, cell in enumerate(cells):
+        # row separators and anything else that is not a digit simply never joins a layer
+        if 48 <= cell <= 57:
+            layers[cell - 48].append(offset)
 
-def move_right(p: g.Point):
-    return g.move_right(p[0]), p[1]
+    return layers
 
 
-def move_down(p: g.Point):
-    return p[0], g.move_down(p[1])
+# a trail climbs one level per step, so every peak reachable from a cell lies within 9 steps on each axis
+WINDOW = 19
+CENTER = 9 * WINDOW + 9
 
 
-def move_left(p: g.Point):
-    return g.move_left(p[0]), p[1]
+def trail_scores(grid: g.Grid) -> dict[g.Point, int]:
+    view = grid.view()
+    stride = view.shape[1]
+    cells = view.tobytes()
+    layers = cells_by_elevation(cells)
 
+    # a cell's bitset holds the peaks reachable from it by a rising trail, indexed by their position relative to
+    # the cell inside a WINDOW x WINDOW square; taking a neighbour's set just shifts it by the neighbour's offset,
+    # so sets stay a few hundred bits wide however large the map is
+    neighbors = ((-stride, -WINDOW), (1, 1), (stride, WINDOW), (-1, -1))
 
-def find_peaks(grid: g.Grid, position: g.Point) -> set[g.Point]:
-    current_elevation = int(grid.get(position))
+    peaks = [0] * len(cells)
+    for offset in layers[9]:
+        peaks[offset] = 1 << CENTER
 
-    if current_elevation == 9:
-        return set([position])
+    for elevation in range(8, -1, -1):
+        above = ord("0") + elevation + 1
 
-    next_elevation = current_elevation + 1
-    peaks: set[g.Point] = set()
+        for offset in layers[elevation]:
+            reachable = 0
 
-    p = move_up(position)
-    if grid.is_in_bounds(p):
-        v = int(grid.get(p))
-        if v == next_elevation:
-            peaks = peaks.union(find_peaks(grid, p))
+            for step, shift in neighbors:
+                neighbor = offset + step
+                if 0 <= neighbor < len(cells) and cells[neighbor] == above:
+                    reachable |= peaks[neighbor] << shift if shift > 0 else peaks[neighbor] >> -shift
 
-    p = move_right(position)
-    if grid.is_in_bounds(p):
-        v = int(grid.get(p))
-        if v == next_elevation:
-            peaks = peaks.union(find_peaks(grid, p))
+            peaks[offset] = reachable
 
-    p = move_down(position)
-    if grid.is_in_bounds(p):
-        v = int(grid.get(p))
-        if v == next_elevation:
-            peaks = peaks.union(find_peaks(grid, p))
-
-    p = move_left(position)
-    if grid.is_in_bounds(p):
-        v = int(grid.get(p))
-        if v == next_elevation:
-            peaks = peaks.union(find_peaks(grid, p))
-
-    return peaks
+    return {(offset % stride, offset // stride): peaks[offset].bit_count() for offset in layers[0]}
 
 
 def solve(input_file: pathlib.Path) -> str:
-    trailheads: list[g.Point] = []
-
     rows = list(read_input_lines_v2(input_file))
     grid = g.Grid(rows)
 
-    for y, row in grid:
-        for x, col in row:
-            if col == "0":
-                trailheads.append((x, y))
-
-    logging.debug(f"{trailheads=}")
+    scores = trail_scores(grid)
 
-    result: int = 0
+    logging.debug(f"{scores=}")
 
-    for trailhead in trailheads:
-        result += len(find_peaks(grid, trailhead))
+    result = sum(scores.values())
 
     return f"{result=}"
 
@@ -6,75 +6,55 @@ from aoc.puzzle_input import read_input_lines_v2
 from aoc.solver import solver
 
 
-def move_up(p: g.Point):
-    return p[0], g.move_up(p[1])
+def cells_by_elevation(cells: bytes) -> list[list[int]]:
+    layers: list[list[int]] = [[] for _ in range(10)]
 
+    for offset, cell in enumerate(cells):
+        # row separators and anything else that is not a digit simply never joins a layer
+        if 48 <= cell <= 57:
+            layers[cell - 48].append(offset)
 
-def move_right(p: g.Point):
-    return g.move_right(p[0]), p[1]
+    return layers
 
 
-def move_down(p: g.Point):
-    return p[0], g.move_down(p[1])
+def trail_ratings(grid: g.Grid) -> dict[g.Point, int]:
+    view = grid.view()
+    stride = view.shape[1]
+    cells = view.tobytes()
+    steps = (-stride, 1, stride, -1)
+    layers = cells_by_elevation(cells)
 
+    # a cell's rating is the number of rising trails from it to any peak, which is the sum of the ratings of the
+    # neighbours one step higher; filling from the top layer down visits every cell once
+    ratings = [0] * len(cells)
+    for offset in layers[9]:
+        ratings[offset] = 1
 
-def move_left(p: g.Point):
-    return g.move_left(p[0]), p[1]
+    for elevation in range(8, -1, -1):
+        above = ord("0") + elevation + 1
 
+        for offset in layers[elevation]:
+            rating = 0
 
-def find_peaks(grid: g.Grid, position: g.Point) -> int:
-    current_elevation = int(grid.get(position))
+            for step in steps:
+                neighbor = offset + step
+                if 0 <= neighbor < len(cells) and cells[neighbor] == above:
+                    rating += ratings[neighbor]
 
-    if current_elevation == 9:
-        return 1
+            ratings[offset] = rating
 
-    next_elevation = current_elevation + 1
-    peaks: int = 0
-
-    p = move_up(position)
-    if grid.is_in_bounds(p):
-        v = int(grid.get(p))
-        if v == next_elevation:
-            peaks += find_peaks(grid, p)
-
-    p = move_right(position)
-    if grid.is_in_bounds(p):
-        v = int(grid.get(p))
-        if v == next_elevation:
-            peaks += find_peaks(grid, p)
-
-    p = move_down(position)
-    if grid.is_in_bounds(p):
-        v = int(grid.get(p))
-        if v == next_elevation:
-            peaks += find_peaks(grid, p)
-
-    p = move_left(position)
-    if grid.is_in_bounds(p):
-        v = int(grid.get(p))
-        if v == next_elevation:
-            peaks += find_peaks(grid, p)
-
-    return peaks
+    return {(offset % stride, offset // stride): ratings[offset] for offset in layers[0]}
 
 
 def solve(input_file: pathlib.Path) -> str:
-    trailheads: list[g.Point] = []
-
     rows = list(read_input_lines_v2(input_file))
     grid = g.Grid(rows)
 
-    for y, row in grid:
-        for x, col in row:
-            if col == "0":
-                trailheads.append((x, y))
-
-    logging.debug(f"{trailheads=}")
+    ratings = trail_ratings(grid)
 
-    result: int = 0
+    logging.debug(f"{ratings=}")
 
-    for trailhead in trailheads:
-        result += find_peaks(grid, trailhead)
+    result = sum(ratings.values())
 
     return f"{result=}"
 
@@ -1,7 +1,6 @@
 import pathlib
-import re
 
-from aoc.puzzle_input import read_input_lines_v2
+from aoc.puzzle_input import read_input_ints
 from aoc.solver import solver
 
 
@@ -9,11 +8,6 @@ Robot = tuple[int, int, int, int]
 Size = tuple[int, int]
 
 
-def read_coord_pairs(line: str) -> Robot:
-    px, py, vx, vy = map(int, re.findall(r"-?\d+", line))
-    return px, py, vx, vy
-
-
 def move_robot(size: Size, robot: Robot) -> Robot:
     px, py, vx, vy = robot
     return (px + vx) % size[0], (py + vy) % size[1], vx, vy
@@ -51,7 +45,7 @@ def solve(input_file: pathlib.Path) -> str:
         grid_size = (101, 103)
 
     robots: list[Robot] = []
-    for px, py, vx, vy in map(read_coord_pairs, read_input_lines_v2(input_file)):
+    for px, py, vx, vy in read_input_ints(input_file):
         robots.append((px, py, vx, vy))
 
     for i in range(10_000):
@@ -1,6 +1,9 @@
+import math
 import os
 import pathlib
 
+from aoc import graph
+from aoc.grid import Grid
 from aoc.puzzle_input import read_input_lines_v2
 from aoc.solver import solver
 
@@ -8,17 +11,20 @@ from aoc.solver import solver
 Point = tuple[int, int]
 Node = tuple[int, int, str]
 
+DIRECTIONS = ("l", "r", "u", "d")
+WALL = ord("#")
+# Grid ends every row with this separator, which must not be walked through or it wraps onto the next row
+NEWLINE = ord("\n")
+
 
 def wait_for_keyboard() -> None:
     if os.getenv("WAIT") == "1":
         input("(wait)")
 
 
-def find_char_or_raise(lines: list[str], ch: str) -> Point:
-    for y, row in enumerate(lines):
-        for x, cell in enumerate(row):
-            if cell == ch:
-                return (x, y)
+def find_char_or_raise(grid: Grid, ch: str) -> Point:
+    for point in grid.where(lambda cell: cell == ch):
+        return point
 
     raise RuntimeError("unable to find char in grid: " + ch)
 
@@ -32,17 +38,8 @@ def flip_direction(direction: str) -> str:
     }[direction]
 
 
-def get_cell(lines: list[str], point_x: int, point_y: int) -> str:
-    for y, row in enumerate(lines):
-        for x, cell in enumerate(row):
-            if x == point_x and y == point_y:
-                return cell
-
-    raise RuntimeError(f"invalid cell coordinate: {(point_x, point_y)}")
-
-
-def search(lines: list[str], point_x: int, point_y: int, direction: str, weight: int, visits: set[Node], depth: int):
-    cell = get_cell(lines, point_x, point_y)
+def search(grid: Grid, point_x: int, point_y: int, direction: str, weight: int, visits: set[Node], depth: int):
+    cell = grid.get((point_x, point_y))
 
     if cell == "#":
         yield False, 0
@@ -78,77 +75,37 @@ def search(lines: list[str], point_x: int, point_y: int, direction: str, weight:
             yield (next_point_x, next_point_y, next_direction, next_weight, visits.copy(), depth + 1)
 
 
-def build_graph(
-    graph: dict[Node, dict[Node, int]], all_points: set[Node], point_x: int, point_y: int, point_d: str
-) -> None:
-    next_positions = [
-        (point_x + 1, point_y, "r"),
-        (point_x - 1, point_y, "l"),
-        (point_x, point_y + 1, "u"),
-        (point_x, point_y - 1, "d"),
-    ]
-
-    connections = {}
+def node_neighbors(cells: bytes, stride: int) -> graph.Neighbors:
+    # node ids are flat cell offset * 4 + direction index, so states are expanded on demand from the raw cells
+    steps = (-1, 1, stride, -stride)
 
-    for nx, ny, nd in next_positions:
-        if nd == point_d:
-            nw = 1
-        else:
-            nw = 1001
+    def neighbors(node: graph.NodeId):
+        offset, direction = divmod(node, 4)
 
-        if (nx, ny, nd) not in all_points:
-            continue
+        for next_direction, step in enumerate(steps):
+            next_offset = offset + step
 
-        connections[(nx, ny, nd)] = nw
+            if 0 <= next_offset < len(cells) and cells[next_offset] not in (WALL, NEWLINE):
+                yield next_offset * 4 + next_direction, 1 if next_direction == direction else 1001
 
-    graph[(point_x, point_y, point_d)] = connections
+    return neighbors
 
 
 def solve(input_file: pathlib.Path) -> str:
     lines = list(read_input_lines_v2(input_file))
+    grid = Grid(lines)
 
-    start_x, start_y = find_char_or_raise(lines, "S")
-    end_x, end_y = find_char_or_raise(lines, "E")
-
-    unvisited = set()
-    for y, row in enumerate(lines):
-        for x, cell in enumerate(row):
-            if cell != "#":
-                for d in ("l", "r", "u", "d"):
-                    unvisited.add((x, y, d))
-
-    graph = {}
-    for x, y, d in unvisited:
-        build_graph(graph, unvisited, x, y, d)
-
-    distances: dict[tuple[int, int, str], int] = {}
+    start_x, start_y = find_char_or_raise(grid, "S")
+    end_x, end_y = find_char_or_raise(grid, "E")
 
-    for node in graph:
-        distances[node] = 999999999
+    view = grid.view()
+    stride = view.shape[1]
+    cells = view.tobytes()
 
-    distances[(start_x, start_y, "r")] = 0
+    def node_id(x: int, y: int, direction: str) -> graph.NodeId:
+        return (y * stride + x) * 4 + DIRECTIONS.index(direction)
 
-    print("progress 0.0%", end="")
-
-    total = len(unvisited)
-
-    while len(unvisited) > 0:
-        visited_count = total - len(unvisited)
-
-        if visited_count % 100 == 0:
-            print(f"\rprogress {(visited_count / total) * 100:.1f}%", end="")
-
-        next_visit = min(unvisited, key=lambda point: distances.get(point, float("inf")))
-
-        unvisited.remove(next_visit)
-
-        for neighbor, weight in graph[next_visit].items():
-            neighbor_distance = distances[next_visit] + weight
-
-            if neighbor_distance < distances[neighbor]:
-                distances[neighbor] = neighbor_distance
-
-    print("\rprogress 100.0%")
+    paths = graph.dijkstra(len(cells) * 4, node_neighbors(cells, stride), [node_id(start_x, start_y, "r")])
 
     possible_end_points = [
         (end_x, end_y, "u"),
@@ -159,10 +116,14 @@ def solve(input_file: pathlib.Path) -> str:
 
     possible_solutions = []
     for point in possible_end_points:
-        possible_solutions.append(distances.get(point))
+        possible_solutions.append(paths.distances[node_id(*point)])
 
     result = min(possible_solutions)
 
+    if math.isinf(result):
+        # what the original search reported when the end is walled off
+        result = 999999999
+
     return f"{result=}"
 
 
@@ -0,0 +1,16 @@
+from d16.a import solve
+
+
+def test_open_edged_maze(tmp_path):
+    # no wall border: the only route goes down and round, stepping right off the first row must not wrap onto E
+    input_file = tmp_path / "maze.txt"
+    input_file.write_text("..#S\nE##.\n....\n")
+
+    assert solve(input_file) == "result=3006"
+
+
+def test_unreachable_end(tmp_path):
+    input_file = tmp_path / "maze.txt"
+    input_file.write_text("S#..\n.#.#\n.#E.\n")
+
+    assert solve(input_file) == "result=999999999"
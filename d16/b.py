@@ -1,6 +1,8 @@
 import os
 import pathlib
 
+from aoc import graph
+from aoc.grid import Grid
 from aoc.puzzle_input import read_input_lines_v2
 from aoc.solver import solver
 
@@ -8,17 +10,19 @@ from aoc.solver import solver
 Point = tuple[int, int]
 Node = tuple[int, int, str]
 
+DIRECTIONS = ("l", "r", "u", "d")
+WALL = ord("#")
+NEWLINE = ord("\n")
+
 
 def wait_for_keyboard() -> None:
     if os.getenv("WAIT") == "1":
         input("(wait)")
 
 
-def find_char_or_raise(lines: list[str], ch: str) -> Point:
-    for y, row in enumerate(lines):
-        for x, cell in enumerate(row):
-            if cell == ch:
-                return (x, y)
+def find_char_or_raise(grid: Grid, ch: str) -> Point:
+    for point in grid.where(lambda cell: cell == ch):
+        return point
 
     raise RuntimeError("unable to find char in grid: " + ch)
 
@@ -32,17 +36,8 @@ def flip_direction(direction: str) -> str:
     }[direction]
 
 
-def get_cell(lines: list[str], point_x: int, point_y: int) -> str:
-    for y, row in enumerate(lines):
-        for x, cell in enumerate(row):
-            if x == point_x and y == point_y:
-                return cell
-
-    raise RuntimeError(f"invalid cell coordinate: {(point_x, point_y)}")
-
-
-def search(lines: list[str], point_x: int, point_y: int, direction: str, weight: int, visits: set[Node], depth: int):
-    cell = get_cell(lines, point_x, point_y)
+def search(grid: Grid, point_x: int, point_y: int, direction: str, weight: int, visits: set[Node], depth: int):
+    cell = grid.get((point_x, point_y))
 
     if cell == "#":
         yield False, 0
@@ -78,105 +73,48 @@ def search(lines: list[str], point_x: int, point_y: int, direction: str, weight:
             yield (next_point_x, next_point_y, next_direction, next_weight, visits.copy(), depth + 1)
 
 
-def build_graph(
-    graph: dict[Node, dict[Node, int]], all_points: set[Node], point_x: int, point_y: int, point_d: str
-) -> None:
-    connections = {}
+def node_neighbors(cells: bytes, stride: int) -> graph.Neighbors:
+    # node ids are flat cell offset * 4 + direction index, so states are expanded on demand from the raw cells
+    steps = (-1, 1, -stride, stride)
 
-    for nd in ("r", "l", "u", "d"):
-        if flip_direction(point_d) == nd:
-            continue
+    def neighbors(node: graph.NodeId):
+        offset, direction = divmod(node, 4)
+        next_offset = offset + steps[direction]
 
-        if nd == point_d:
-            nw = 1
+        if 0 <= next_offset < len(cells) and cells[next_offset] not in (WALL, NEWLINE):
+            yield node + steps[direction] * 4, 1
 
-            match nd:
-                case "l":
-                    nx = point_x - 1
-                    ny = point_y
-                case "r":
-                    nx = point_x + 1
-                    ny = point_y
-                case "u":
-                    nx = point_x
-                    ny = point_y - 1
-                case "d":
-                    nx = point_x
-                    ny = point_y + 1
-        else:
-            nx = point_x
-            ny = point_y
-            nw = 1000
-
-        if (nx, ny, nd) not in all_points:
-            continue
+        # the direction index pairs (l, r) and (u, d), so xor 1 is the reverse
+        for next_direction in range(4):
+            if next_direction != direction and next_direction != direction ^ 1:
+                yield node - direction + next_direction, 1000
 
-        connections[(nx, ny, nd)] = nw
-
-    graph[(point_x, point_y, point_d)] = connections
+    return neighbors
 
 
 def solve(input_file: pathlib.Path) -> str:
     lines = list(read_input_lines_v2(input_file))
+    grid = Grid(lines)
 
-    start_x, start_y = find_char_or_raise(lines, "S")
-    end_x, end_y = find_char_or_raise(lines, "E")
-
-    unvisited = set()
-    for y, row in enumerate(lines):
-        for x, cell in enumerate(row):
-            if cell != "#":
-                for d in ("l", "r", "u", "d"):
-                    unvisited.add((x, y, d))
-
-    graph = {}
-    for x, y, d in unvisited:
-        build_graph(graph, unvisited, x, y, d)
-
-    distances: dict[tuple[int, int, str], int] = {}
-
-    for node in graph:
-        distances[node] = 999999999
-
-    distances[(start_x, start_y, "r")] = 0
-
-    paths: dict[tuple[int, int, str], set[tuple[int, int, str]]] = {}
-
-    for point in unvisited:
-        paths[point] = set([point])
-
-    print("progress 0.0%", end="")
-
-    total = len(unvisited)
-
-    while len(unvisited) > 0:
-        visited_count = total - len(unvisited)
-
-        if visited_count % 100 == 0:
-            print(f"\rprogress {(visited_count / total) * 100:.1f}%", end="")
-
-        current = min(unvisited, key=lambda p: distances[p])
-
-        unvisited.remove(current)
-
-        for neighbor, weight in graph[current].items():
-            neighbor_distance = distances[current] + weight
+    start_x, start_y = find_char_or_raise(grid, "S")
+    end_x, end_y = find_char_or_raise(grid, "E")
 
-            if neighbor_distance < distances[neighbor]:
-                distances[neighbor] = neighbor_distance
-                paths[neighbor] = paths[current].copy() | {neighbor}
+    view = grid.view()
+    stride = view.shape[1]
+    cells = view.tobytes()
 
-            if neighbor_distance == distances[neighbor]:
-                paths[neighbor].update(paths[current])
-                paths[neighbor].add(neighbor)
+    def node_id(x: int, y: int, direction: str) -> graph.NodeId:
+        return (y * stride + x) * 4 + DIRECTIONS.index(direction)
 
-    print("\rprogress 100.0%")
+    paths = graph.dijkstra(len(cells) * 4, node_neighbors(cells, stride), [node_id(start_x, start_y, "r")])
 
-    possible_end_points = [(end_x, end_y, "u"), (end_x, end_y, "r")]
-    shortest_end_point = min(possible_end_points, key=lambda x: distances[x])
+    end_ids = [node_id(end_x, end_y, "u"), node_id(end_x, end_y, "r")]
+    shortest_distance = min(paths.distances[node] for node in end_ids)
+    shortest_end_ids = [node for node in end_ids if paths.distances[node] == shortest_distance]
 
     unique_points = set()
-    for x, y, _ in paths[shortest_end_point]:
+    for node in paths.nodes_on_shortest_paths(shortest_end_ids):
+        y, x = divmod(node // 4, stride)
         unique_points.add((x, y))
 
     for y, row in enumerate(lines):
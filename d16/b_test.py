@@ -0,0 +1,8 @@
+from d16.b import solve
+
+
+def test_open_edged_maze(tmp_path):
+    input_file = tmp_path / "maze.txt"
+    input_file.write_text("..#S\nE##.\n....\n")
+
+    assert solve(input_file) == "result=7"
@@ -1,149 +1,61 @@
-import dataclasses
-import logging
 import pathlib
 
-from aoc.puzzle_input import read_input_lines_v2
+from aoc.graph import DisjointSet
+from aoc.metrics import phase
+from aoc.puzzle_input import read_int_matrix
 from aoc.solver import solver
 
 Point = tuple[int, int]
 
 
-@dataclasses.dataclass
-class Node:
-    position: Point
-    f_score: float
-    g_score: float
-    previous_node: "Node | None"
-
-    def __hash__(self) -> int:
-        return hash(self.position)
-
-
-def pop_lowest_cost_node(node_set: set[Node]) -> Node:
-    lowest_node = min(node_set, key=lambda x: x.f_score)
-    node_set.remove(lowest_node)
-    return lowest_node
-
-
-def create_path(source_node: Node, target_node: Node) -> list[Point]:
-    current_node = target_node
-
-    path = []
-    while True:
-        path.insert(0, current_node.position)
-
-        if current_node == source_node or current_node.previous_node is None:
-            break
-
-        current_node = current_node.previous_node
-
-    return path
-
-
-def get_heuristic_value(a: tuple[int, int], b: tuple[int, int]) -> float:
-    ax, ay = a
-    bx, by = b
-    return (((bx - ax) ** 2) + ((by - ay) ** 2)) ** 0.5
-
-
-def shortest_path(graph: dict[Point, list[Point]], source: Point, target: Point):
-    nodes: dict[Point, Node] = {}
-    nodes[source] = Node(position=source, f_score=get_heuristic_value(source, target), g_score=0, previous_node=None)
-
-    open_set: set[Node] = set()
-    open_set.add(nodes[source])
-
-    closed_set: set[Point] = set()
-
-    while len(open_set) > 0:
-        current_node = pop_lowest_cost_node(open_set)
-
-        if current_node.position == target:
-            return create_path(nodes[source], current_node)
-
-        closed_set.add(current_node.position)
-
-        for neighbor in graph[current_node.position]:
-            if neighbor in closed_set:
-                continue
-
-            potential_g_score = current_node.g_score + 1
-
-            if neighbor not in nodes:
-                neighbor_node = Node(
-                    position=neighbor,
-                    f_score=float("inf"),
-                    g_score=float("inf"),
-                    previous_node=None,
-                )
-                nodes[neighbor] = neighbor_node
-            else:
-                neighbor_node = nodes[neighbor]
-
-            if potential_g_score >= neighbor_node.g_score:
-                continue
-
-            neighbor_node.previous_node = current_node
-            neighbor_node.g_score = potential_g_score
-            neighbor_node.f_score = potential_g_score + get_heuristic_value(neighbor, target)
-
-            if neighbor_node not in open_set:
-                open_set.add(neighbor_node)
-
-    return None
-
-
-def build_graph(grid_size: tuple[int, int], bytes_fallen: set[Point]) -> dict[Point, list[Point]]:
+def find_blocking_byte(grid_size: tuple[int, int], byte_positions: list[Point]) -> Point | None:
+    # start from the fully fallen grid and lift bytes off in reverse; the byte whose removal first
+    # joins start and goal is the one that cut them apart
     w, h = grid_size
+    start = 0
+    goal = w * h - 1
 
-    graph: dict[Point, list[Point]] = {}
-
-    for y in range(h):
-        for x in range(w):
-            if (x, y) in bytes_fallen:
-                continue
-
-            potential_positions = (
-                (x + 1, y),
-                (x - 1, y),
-                (x, y + 1),
-                (x, y - 1),
-            )
-
-            neighbors = []
+    fall_order = [-1] * (w * h)
+    for i, (x, y) in enumerate(byte_positions):
+        if fall_order[y * w + x] == -1:
+            fall_order[y * w + x] = i
 
-            for p in potential_positions:
-                if p in bytes_fallen:
-                    continue
+    sets = DisjointSet(w * h)
 
-                px, py = p
+    def open_cell(cell: int) -> None:
+        x = cell % w
 
-                if px < 0 or py < 0 or px >= w or py >= h:
-                    continue
+        if x > 0 and fall_order[cell - 1] == -1:
+            sets.union(cell, cell - 1)
+        if x < w - 1 and fall_order[cell + 1] == -1:
+            sets.union(cell, cell + 1)
+        if cell >= w and fall_order[cell - w] == -1:
+            sets.union(cell, cell - w)
+        if cell + w <= goal and fall_order[cell + w] == -1:
+            sets.union(cell, cell + w)
 
-                neighbors.append(p)
+    for cell in range(w * h):
+        if fall_order[cell] == -1:
+            open_cell(cell)
 
-            graph[(x, y)] = neighbors
+    if sets.connected(start, goal):
+        return None
 
-    return graph
+    for i in range(len(byte_positions) - 1, -1, -1):
+        x, y = byte_positions[i]
+        cell = y * w + x
 
+        # a byte that lands on an already fallen cell changes nothing
+        if fall_order[cell] != i:
+            continue
 
-def draw_path(grid_size: tuple[int, int], byte_positions: set[Point], path: list[Point]) -> None:
-    w, h = grid_size
+        fall_order[cell] = -1
+        open_cell(cell)
 
-    path_points = set(path)
+        if fall_order[start] == -1 and fall_order[goal] == -1 and sets.connected(start, goal):
+            return x, y
 
-    for y in range(h):
-        for x in range(w):
-            p = (x, y)
-            if p in path_points:
-                print("O", end="")
-            elif p in byte_positions:
-                print("#", end="")
-            else:
-                print(".", end="")
-        print()
-    print()
+    return None
 
 
 def solve(input_file: pathlib.Path) -> str:
@@ -152,42 +64,15 @@ def solve(input_file: pathlib.Path) -> str:
     if "sample" in input_file.name:
         grid_size = (7, 7)
 
-    byte_positions = []
-    for line in read_input_lines_v2(input_file):
-        x, y = map(int, line.split(","))
-        byte_positions.append((x, y))
-
-    bytes_fallen = set()
-    last_byte_position: Point = (0, 0)
-
-    while True:
-        last_byte_position = byte_positions.pop(0)
-        bytes_fallen.add(last_byte_position)
-
-        lines = []
-        for y in range(grid_size[1]):
-            row = []
-
-            for x in range(grid_size[0]):
-                if (x, y) in bytes_fallen:
-                    row.append("#")
-                else:
-                    row.append(".")
-
-            lines.append(row)
-
-        start_position = (0, 0)
-        exit_position = (grid_size[0] - 1, grid_size[1] - 1)
-
-        graph = build_graph(grid_size, bytes_fallen)
-
-        path = shortest_path(graph, start_position, exit_position)
-        if path is None:
-            result = f"{last_byte_position[0]},{last_byte_position[1]}"
-            break
+    with phase("parse"):
+        positions = read_int_matrix(input_file, sep=",")
+        byte_positions = list(zip(positions.column(0), positions.column(1)))
 
-        # draw_path(grid_size, bytes_fallen, path)
+    blocking_byte = find_blocking_byte(grid_size, byte_positions)
+    if blocking_byte is None:
+        raise RuntimeError("no byte blocks the exit")
 
+    result = f"{blocking_byte[0]},{blocking_byte[1]}"
     return f"{result=}"
 
 
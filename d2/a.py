@@ -1,13 +1,11 @@
 import logging
 import pathlib
 
-from aoc.puzzle_input import read_input_lines
+from aoc.puzzle_input import read_int_matrix
 from aoc.solver import solver
 
 
-def is_report_safe(i: int, line: str) -> bool:
-    levels = list(map(int, line.strip().split()))
-
+def is_report_safe(i: int, levels: list[int]) -> bool:
     assert len(levels) > 2, "I expected at least 2 levels in each report"
 
     direction = 1 if levels[0] < levels[1] else -1
@@ -41,15 +39,18 @@ def is_report_safe(i: int, line: str) -> bool:
 def solve(input_file: pathlib.Path) -> str:
     safe_levels = 0
 
-    for i, line in enumerate(read_input_lines(input_file)):
-        line = line.strip()
-        is_safe = is_report_safe(i, line)
+    reports = read_int_matrix(input_file, ragged=True)
+
+    for i in range(reports.row_count()):
+        levels = reports.row(i).tolist()
+
+        is_safe = is_report_safe(i, levels)
 
         if is_safe:
-            logging.info(f"safe    : {line}")
+            logging.info(f"safe    : {levels}")
             safe_levels += 1
         else:
-            logging.info(f"not safe: {line}")
+            logging.info(f"not safe: {levels}")
 
     return f"{safe_levels=}"
 
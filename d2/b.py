@@ -2,7 +2,7 @@ import logging
 import pathlib
 
 from aoc.color import blue, purple, yellow
-from aoc.puzzle_input import read_input_lines
+from aoc.puzzle_input import read_int_matrix
 from aoc.solver import solver
 
 
@@ -48,13 +48,14 @@ def is_report_safe(levels: list[int]) -> bool:
 def solve(input_file: pathlib.Path) -> str:
     safe_levels = 0
 
-    for i, line in enumerate(read_input_lines(input_file)):
-        line = line.strip()
-        levels = list(map(int, line.split()))
+    reports = read_int_matrix(input_file, ragged=True)
+
+    for i in range(reports.row_count()):
+        levels = reports.row(i).tolist()
 
         assert len(levels) > 2, "I expected at least 2 levels in each report"
 
-        logging.info(blue(f"report {i}: {line}"))
+        logging.info(blue(f"report {i}: {levels}"))
 
         is_safe = False
 
@@ -1,10 +1,21 @@
+import array
+import concurrent.futures
+import dataclasses
 import logging
+import os
 import pathlib
+import typing
+from multiprocessing import shared_memory
 
 from aoc import grid as g
 from aoc.puzzle_input import read_input_lines
 from aoc.solver import solver
 
+DIRECTIONS = ("up", "right", "down", "left")
+WALL = ord("#")
+NEWLINE = ord("\n")
+EXIT = -1
+
 
 def print_grid(
     name: str,
@@ -97,7 +108,7 @@ def iter_grid(grid: g.Grid, start_position: g.Point, start_direction: str, obsta
         yield position, direction
 
 
-def is_loop(
+def trace_loop(
     grid: g.Grid,
     start_position: g.Point,
     start_direction: str,
@@ -107,10 +118,10 @@ def is_loop(
 ) -> bool:
     step_count = 0
 
-    trace_path = trace_path or set()
+    trace_path = set() if trace_path is None else trace_path
     trace_path.add((start_position[0], start_position[1], start_direction))
 
-    trace_visits = trace_visits or set()
+    trace_visits = set() if trace_visits is None else trace_visits
     trace_visits.add(start_position)
 
     for position, direction in iter_grid(grid, start_position, start_direction, obstacle):
@@ -132,156 +143,219 @@ def assert_is_loop(grid: g.Grid, start_position: g.Point, start_direction: str,
     path = set()
     visits = set()
 
-    if not is_loop(grid, start_position, start_direction, obstacle, trace_path=path, trace_visits=visits):
+    if not trace_loop(grid, start_position, start_direction, obstacle, trace_path=path, trace_visits=visits):
         print_grid("failed_loop", grid, start_position, start_direction, visits, path, obstacle)
         assert False, "did not loop"
 
 
-def solve(input_file: pathlib.Path) -> str:
-    result: int = 0
+@dataclasses.dataclass
+class PatrolMap:
+    cells: typing.Sequence[int]
+    stride: int
+    steps: tuple[int, ...]
+    # jumps[d][c] is the last open cell the guard reaches walking from c in direction d, or EXIT
+    jumps: list[typing.Sequence[int]]
+
+    def offset(self, point: g.Point) -> int:
+        return point[1] * self.stride + point[0]
 
-    start_position: g.Point = (0, 0)
-    rows: list[str] = []
-    visits: set[tuple[int, int]] = set()
-    path: set[tuple[int, int, str]] = set()
-    position: tuple[int, int] = (0, 0)
-    direction: str = "up"
+    def point(self, offset: int) -> g.Point:
+        y, x = divmod(offset, self.stride)
+        return x, y
 
-    for y, line in enumerate(read_input_lines(input_file)):
-        line = line.strip()
+    def is_in_bounds(self, offset: int) -> bool:
+        return 0 <= offset < len(self.cells) and self.cells[offset] != NEWLINE
 
-        rows.append(line)
+    def next_stop(self, offset: int, direction: int, obstacle: int) -> int:
+        stop = self.jumps[direction][offset]
+        step = self.steps[direction]
 
-        for x, char in enumerate(line):
-            if char == "^":
-                visits.add((x, y))
-                path.add((x, y, "up"))
-                start_position = (x, y)
-                position = (x, y)
+        # the extra obstacle only matters if it sits on the ray between offset and the table's stop
+        if direction % 2 == 0:
+            on_line = (obstacle - offset) % self.stride == 0
+        else:
+            on_line = obstacle // self.stride == offset // self.stride
 
-    logging.debug(f"visits: {visits}\n{'\n'.join(rows)}")
+        if on_line:
+            if step < 0 and offset > obstacle and (stop == EXIT or obstacle >= stop):
+                return obstacle - step
+            if step > 0 and offset < obstacle and (stop == EXIT or obstacle <= stop):
+                return obstacle - step
+
+        return stop
+
+    def is_loop(self, offset: int, direction: int, obstacle: int) -> bool:
+        # walk the turn graph only: a loop is a (stop, direction) pair seen twice
+        seen: set[int] = set()
+
+        while True:
+            stop = self.next_stop(offset, direction, obstacle)
+
+            if stop == EXIT:
+                return False
+
+            state = stop * 4 + direction
+            if state in seen:
+                return True
+
+            seen.add(state)
+            offset = stop
+            direction = (direction + 1) % 4
+
+
+def build_patrol_map(grid: g.Grid) -> PatrolMap:
+    view = grid.view()
+    stride = view.shape[1]
+    cells = view.tobytes()
+    steps = steps_for(stride)
+
+    jumps = []
+    for step in steps:
+        jump = array.array("q", [EXIT]) * len(cells)
+
+        # fill from the far side so the cell one step ahead is always resolved first
+        order = range(len(cells)) if step < 0 else range(len(cells) - 1, -1, -1)
+        for offset in order:
+            if cells[offset] == NEWLINE:
+                continue
+
+            ahead = offset + step
+            if not (0 <= ahead < len(cells)) or cells[ahead] == NEWLINE:
+                jump[offset] = EXIT
+            elif cells[ahead] == WALL:
+                jump[offset] = offset
+            else:
+                jump[offset] = jump[ahead]
+
+        jumps.append(jump)
+
+    return PatrolMap(cells, stride, steps, jumps)
+
+
+def steps_for(stride: int) -> tuple[int, ...]:
+    return (-stride, 1, stride, -1)
+
+
+# Candidate is (position, direction, obstacle): the guard at position facing direction runs into obstacle next
+Candidate = tuple[int, int, int]
 
-    grid = g.Grid(rows)
 
-    next_position = position
-    next_direction = direction
-    obstacles = set()
+def find_candidates(patrol: PatrolMap, start_position: g.Point) -> list[Candidate]:
+    candidates: list[Candidate] = []
+    visited = bytearray(len(patrol.cells))
+
+    position = patrol.offset(start_position)
+    direction = 0
+    visited[position] = 1
 
     while True:
-        match direction:
-            case "up":
-                next_direction = "right"
-                next_position = position[0], g.move_up(position[1])
-            case "right":
-                next_position = g.move_right(position[0]), position[1]
-                next_direction = "down"
-            case "down":
-                next_position = position[0], g.move_down(position[1])
-                next_direction = "left"
-            case "left":
-                next_position = g.move_left(position[0]), position[1]
-                next_direction = "up"
+        ahead = position + patrol.steps[direction]
 
-        if not grid.is_in_bounds(next_position):
+        if not patrol.is_in_bounds(ahead):
             break
 
-        if grid.get(next_position) == "#":
-            direction = next_direction
-            logging.debug(f"turn {direction}")
-        else:
-            loop_path = set()
-            loop_visits = set()
-            loop_detected = False
-
-            try:
-                loop_detected = is_loop(
-                    grid, position, next_direction, next_position, trace_path=loop_path, trace_visits=loop_visits
-                )
-            except RuntimeError:
-                print("infinite loop")
-                print(f"{position=}, {next_direction=}, {next_position=}")
-                print_grid(
-                    "inifite_loop",
-                    grid,
-                    position,
-                    direction,
-                    loop_visits,
-                    loop_path,
-                    next_position,
-                )
-                exit(1)
-
-            if loop_detected:
-                print_grid(
-                    "obstacle_" + str(len(obstacles)),
-                    grid,
-                    start_position,
-                    "up",
-                    loop_visits,
-                    loop_path,
-                    next_position,
-                )
-                # logging.debug(f"obstacle: {next_position}")
-                # logging.debug(f"next_direction: {next_direction}")
-                # logging.debug(f"next_position: {next_position}")
-                #
-                # if next_position not in obstacles:
-                #     assert_is_loop(grid, position, next_direction, next_position)
-                #
-                #     print_grid(
-                #         "obstacle_" + str(len(obstacles)),
-                #         grid,
-                #         start_position,
-                #         "up",
-                #         potential_visits,
-                #         potential_path,
-                #         next_position,
-                #     )
-
-                obstacles.add(next_position)
-                # break
-
-            # potential_path = path.copy()
-            # potential_visits = visits.copy()
-            # potential_next_position = position
-            #
-            # potential_path.add((position[0], position[1], next_direction))
-            #
-            # while True:
-            #     match next_direction:
-            #         case "up":
-            #             potential_next_position = potential_next_position[0], g.move_up(potential_next_position[1])
-            #         case "right":
-            #             potential_next_position = g.move_right(potential_next_position[0]), potential_next_position[1]
-            #         case "down":
-            #             potential_next_position = potential_next_position[0], g.move_down(potential_next_position[1])
-            #         case "left":
-            #             potential_next_position = g.move_left(potential_next_position[0]), potential_next_position[1]
-            #
-            #     if not grid.is_in_bounds(potential_next_position):
-            #         logging.debug("leave")
-            #         break
-            #
-            #     logging.debug(f"{potential_next_position}, {grid.get(potential_next_position)}")
-            #
-            #     if grid.get(potential_next_position) == "#":
-            #         logging.debug("leave")
-            #         break
-            #
-            #     potential_path.add((potential_next_position[0], potential_next_position[1], next_direction))
-            #     potential_visits.add(potential_next_position)
-            #
-            #     if (potential_next_position[0], potential_next_position[1], next_direction) in path:
+        if patrol.cells[ahead] == WALL:
+            direction = (direction + 1) % 4
+            logging.debug(f"turn {DIRECTIONS[direction]}")
+            continue
 
-            position = next_position
-            visits.add(position)
+        # an obstacle can only go on a cell the guard has not walked through yet, and the loop check starts
+        # right here where the guard would first run into it
+        if not visited[ahead]:
+            visited[ahead] = 1
+            candidates.append((position, direction, ahead))
+
+        position = ahead
+
+    return candidates
+
+
+def share_patrol_map(patrol: PatrolMap) -> shared_memory.SharedMemory:
+    # layout: the four jump tables as int64, then the raw cells
+    size = len(patrol.cells)
+    memory = shared_memory.SharedMemory(create=True, size=size * 8 * 4 + size)
+
+    for direction, jump in enumerate(patrol.jumps):
+        memory.buf[size * 8 * direction : size * 8 * (direction + 1)] = memoryview(jump).cast("B")
+
+    memory.buf[size * 8 * 4 :] = bytes(patrol.cells)
+    return memory
 
-            logging.debug(f"step {position}")
 
-        path.add((position[0], position[1], direction))
+def attach_patrol_map(memory: shared_memory.SharedMemory, stride: int, size: int) -> PatrolMap:
+    jumps = [memory.buf[size * 8 * direction : size * 8 * (direction + 1)].cast("q") for direction in range(4)]
+    cells = memory.buf[size * 8 * 4 : size * 8 * 4 + size]
+    return PatrolMap(cells, stride, steps_for(stride), jumps)
+
+
+_worker_memory: shared_memory.SharedMemory | None = None
+_worker_patrol: PatrolMap | None = None
+
+
+def init_worker(name: str, stride: int, size: int) -> None:
+    global _worker_memory, _worker_patrol
+
+    _worker_memory = shared_memory.SharedMemory(name=name)
+    _worker_patrol = attach_patrol_map(_worker_memory, stride, size)
+
+
+def check_candidates(candidates: list[Candidate]) -> list[bool]:
+    assert _worker_patrol is not None
+    return [_worker_patrol.is_loop(*candidate) for candidate in candidates]
+
+
+def check_candidates_parallel(patrol: PatrolMap, candidates: list[Candidate], jobs: int) -> list[bool]:
+    chunk_size = -(-len(candidates) // (jobs * 4))
+    chunks = [candidates[i : i + chunk_size] for i in range(0, len(candidates), chunk_size)]
+
+    memory = share_patrol_map(patrol)
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=init_worker,
+            initargs=(memory.name, patrol.stride, len(patrol.cells)),
+        ) as executor:
+            # map yields chunk results in submission order, so the answer does not depend on scheduling
+            return [looped for chunk in executor.map(check_candidates, chunks) for looped in chunk]
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def solve(input_file: pathlib.Path) -> str:
+    result: int = 0
+
+    rows = [line.strip() for line in read_input_lines(input_file)]
+    grid = g.Grid(rows)
 
-    if start_position in obstacles:
-        obstacles.remove(start_position)
+    start_position = grid.where(lambda cell: cell == "^")[0]
+    patrol = build_patrol_map(grid)
+    candidates = find_candidates(patrol, start_position)
+
+    jobs = int(os.getenv("JOBS", os.cpu_count() or 1))
+
+    # below a few hundred candidates the pool start-up costs more than the checks themselves
+    if jobs > 1 and len(candidates) >= 512:
+        loops = check_candidates_parallel(patrol, candidates, jobs)
+    else:
+        loops = [patrol.is_loop(*candidate) for candidate in candidates]
+
+    obstacles = [candidate for candidate, looped in zip(candidates, loops) if looped]
+
+    if os.getenv("DRAW") == "1":
+        for i, (position, direction, obstacle) in enumerate(obstacles):
+            loop_path: set[tuple[int, int, str]] = set()
+            loop_visits: set[g.Point] = set()
+
+            trace_loop(
+                grid,
+                patrol.point(position),
+                DIRECTIONS[(direction + 1) % 4],
+                patrol.point(obstacle),
+                trace_path=loop_path,
+                trace_visits=loop_visits,
+            )
+            print_grid("obstacle_" + str(i), grid, start_position, "up", loop_visits, loop_path, patrol.point(obstacle))
 
     result = len(obstacles)
 
@@ -0,0 +1,98 @@
+import random
+
+from aoc import grid as g
+from d6.b import Candidate, build_patrol_map, find_candidates
+
+SAMPLE = [
+    "....#.....",
+    ".........#",
+    "..........",
+    "..#.......",
+    ".......#..",
+    "..........",
+    ".#..^.....",
+    "........#.",
+    "#.........",
+    "......#...",
+]
+
+
+def loop_candidates(rows: list[str]) -> list[Candidate]:
+    grid = g.Grid(rows)
+    patrol = build_patrol_map(grid)
+    start_position = grid.where(lambda cell: cell == "^")[0]
+
+    return [candidate for candidate in find_candidates(patrol, start_position) if patrol.is_loop(*candidate)]
+
+
+def count_loops(rows: list[str]) -> int:
+    return len(loop_candidates(rows))
+
+
+def brute_force(rows: list[str]) -> int | None:
+    width, height = len(rows[0]), len(rows)
+    walls = {(x, y) for y, row in enumerate(rows) for x, cell in enumerate(row) if cell == "#"}
+    start = next((x, y) for y, row in enumerate(rows) for x, cell in enumerate(row) if cell == "^")
+    directions = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+    def walk(obstacle: g.Point | None) -> set[tuple[g.Point, int]] | None:
+        position, direction = start, 0
+        seen: set[tuple[g.Point, int]] = set()
+
+        while (position, direction) not in seen:
+            seen.add((position, direction))
+            dx, dy = directions[direction]
+            ahead = position[0] + dx, position[1] + dy
+
+            if not (0 <= ahead[0] < width and 0 <= ahead[1] < height):
+                return seen
+            if ahead in walls or ahead == obstacle:
+                direction = (direction + 1) % 4
+            else:
+                position = ahead
+
+        return None
+
+    path = walk(None)
+    if path is None:
+        return None
+
+    candidates = {position for position, _ in path} - {start}
+    return sum(walk(candidate) is None for candidate in candidates)
+
+
+def test_sample():
+    assert count_loops(SAMPLE) == 6
+
+
+def test_obstacle_directly_ahead_of_start():
+    # the very first candidate is the cell in front of the start, so its loop check begins on the start cell
+    rows = [
+        "#.#..",
+        "....#",
+        "...#.",
+        "#^..#",
+        "..###",
+    ]
+
+    assert count_loops(rows) == brute_force(rows)
+    # (1, 2) as a flat offset: each row is 5 cells plus the separator
+    assert any(obstacle == 2 * 6 + 1 for *_, obstacle in loop_candidates(rows))
+
+
+def test_matches_brute_force():
+    rng = random.Random(3)
+    checked = 0
+
+    while checked < 60:
+        width, height = rng.randint(3, 12), rng.randint(3, 12)
+        rows = [["#" if rng.random() < 0.15 else "." for _ in range(width)] for _ in range(height)]
+        rows[rng.randrange(height)][rng.randrange(width)] = "^"
+        rows = ["".join(row) for row in rows]
+
+        expected = brute_force(rows)
+        if expected is None:
+            continue
+
+        assert count_loops(rows) == expected, rows
+        checked += 1
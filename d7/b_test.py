@@ -1,31 +1,14 @@
-from d7.b import bitmap_str
+from aoc.equation import is_solvable
+from d7.b import OPERATORS
 
 
-def test_bitmap_str():
-    assert bitmap_str(0, 3) == "000"
-    assert bitmap_str(1, 3) == "001"
-    assert bitmap_str(2, 3) == "002"
-    assert bitmap_str(3, 3) == "010"
-    assert bitmap_str(4, 3) == "011"
-    assert bitmap_str(5, 3) == "012"
-    assert bitmap_str(6, 3) == "020"
-    assert bitmap_str(7, 3) == "021"
-    assert bitmap_str(8, 3) == "022"
-    assert bitmap_str(9, 3) == "100"
-    assert bitmap_str(10, 3) == "101"
-    assert bitmap_str(11, 3) == "102"
-    assert bitmap_str(12, 3) == "110"
-    assert bitmap_str(13, 3) == "111"
-    assert bitmap_str(14, 3) == "112"
-    assert bitmap_str(15, 3) == "120"
-    assert bitmap_str(16, 3) == "121"
-    assert bitmap_str(17, 3) == "122"
-    assert bitmap_str(18, 3) == "200"
-    assert bitmap_str(19, 3) == "201"
-    assert bitmap_str(20, 3) == "202"
-    assert bitmap_str(21, 3) == "210"
-    assert bitmap_str(22, 3) == "211"
-    assert bitmap_str(23, 3) == "212"
-    assert bitmap_str(24, 3) == "220"
-    assert bitmap_str(25, 3) == "221"
-    assert bitmap_str(26, 3) == "222"
+def test_operators():
+    assert is_solvable(190, [10, 19], OPERATORS)
+    assert is_solvable(3267, [81, 40, 27], OPERATORS)
+    assert is_solvable(156, [15, 6], OPERATORS)
+    assert is_solvable(7290, [6, 8, 6, 15], OPERATORS)
+    assert is_solvable(192, [17, 8, 14], OPERATORS)
+    assert is_solvable(292, [11, 6, 16, 20], OPERATORS)
+    assert not is_solvable(83, [17, 5], OPERATORS)
+    assert not is_solvable(161011, [16, 10, 13], OPERATORS)
+    assert not is_solvable(21037, [9, 7, 18, 13], OPERATORS)
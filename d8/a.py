@@ -25,13 +25,11 @@ def solve(input_file: pathlib.Path) -> str:
     grid = g.Grid(list(read_input_lines_v2(input_file)))
 
     antennas: dict[str, set[Point]] = {}
-    for y, row in grid:
-        for x, char in row:
-            if char == ".":
-                continue
+    for point in grid.where(lambda char: char != "."):
+        char = grid.get(point)
 
-            antennas.setdefault(char, set())
-            antennas[char].add((x, y))
+        antennas.setdefault(char, set())
+        antennas[char].add(point)
 
     logging.debug(f"Grid: {grid}, Antennas: {antennas}")
 
@@ -1,105 +1,73 @@
-import logging
 import pathlib
 
-from aoc.puzzle_input import read_input
+from aoc.metrics import phase
+from aoc.puzzle_input import read_input_bytes
 from aoc.solver import solver
 
 
-def first_empty(file_system: list[int], minbound: int) -> int:
-    assert 0 <= minbound < len(file_system)
+ZERO = ord("0")
 
-    cursor = minbound
 
-    while cursor < len(file_system):
-        if file_system[cursor] == -1:
-            return cursor
+def series(start: int, size: int) -> int:
+    # start + (start + 1) + ... + (start + size - 1)
+    return size * start + size * (size - 1) // 2
 
-        cursor += 1
 
-    return 99999999999
-
-
-def last_non_empty(file_system: list[int], maxbound: int) -> int:
-    assert 0 <= maxbound < len(file_system)
-
-    cursor = maxbound
-
-    while cursor >= 0:
-        if file_system[cursor] > -1:
-            return cursor
-
-        cursor -= 1
-
-    return -99999999999
-
-
-def move_bit(file_system: list[int], source: int, target: int):
-    assert 0 <= source < len(file_system)
-    assert 0 <= target < len(file_system)
-
-    file_system[target] = file_system[source]
-    file_system[source] = -1
-
-
-def compress_file_system(file_system: list[int]) -> list[int]:
-    left = first_empty(file_system, 0)
-    right = last_non_empty(file_system, len(file_system) - 1)
-
-    while True:
-        if left >= right:
-            break
-
-        move_bit(file_system, right, left)
-
-        left = first_empty(file_system, left)
-        right = last_non_empty(file_system, right)
-
-    assert right <= len(file_system), "right ended up too large"
-
-    return file_system[0 : right + 1]
-
-
-def create_file_system(disk_map: list[int]) -> list[int]:
-    file_system: list[int] = []
-    block_id = 0
+def compact_checksum(disk_map: memoryview) -> int:
+    # disk_map is the raw ascii digits; files at even indexes, gaps at odd ones. The left cursor walks the map in
+    # order and every gap it meets is filled from the file under the right cursor, so the checksum streams out
+    # without the blocks ever existing.
+    left = 0
+    right = len(disk_map) - 1 if len(disk_map) % 2 == 1 else len(disk_map) - 2
+    right_remaining = disk_map[right] - ZERO
+    position = 0
+    result = 0
 
-    for i, value in enumerate(disk_map):
-        is_block = i % 2 == 0
+    while left < right:
+        size = disk_map[left] - ZERO
+        result += left // 2 * series(position, size)
+        position += size
+        left += 1
 
-        if is_block:
-            file_system += [block_id] * value
-            block_id += 1
-        else:
-            file_system += [-1] * value
+        gap = disk_map[left] - ZERO
 
-    return file_system
+        while gap > 0 and left < right:
+            size = min(gap, right_remaining)
+            result += right // 2 * series(position, size)
+            position += size
+            gap -= size
+            right_remaining -= size
 
+            if right_remaining == 0:
+                right -= 2
+                right_remaining = disk_map[right] - ZERO if right >= 0 else 0
 
-def compute_file_system_checksum(file_system: list[int]) -> int:
-    result = 0
+        left += 1
 
-    for i, value in enumerate(file_system):
-        result += i * value
+    # whatever is left of the file both cursors met on stays where the left cursor put it
+    if left == right:
+        result += right // 2 * series(position, right_remaining)
 
     return result
 
 
 def solve(input_file: pathlib.Path) -> str:
-    disk_map = list(map(int, read_input(input_file).strip()))
-
-    logging.debug(f"{disk_map=}")
-
-    file_system = create_file_system(disk_map)
+    with phase("parse"):
+        line = next(read_input_bytes(input_file), None)
 
-    logging.debug(f"{file_system=}")
+    assert line is not None, "file system is empty"
 
-    assert len(file_system) > 0, "file system is empty"
+    # the reader only splits on \n, so a \r or trailing blank would otherwise be read as a digit; slicing the view
+    # trims them without copying the line
+    end = len(line)
+    while end > 0 and line[end - 1] < ZERO:
+        end -= 1
 
-    file_system = compress_file_system(file_system)
+    disk_map = line[:end]
 
-    logging.debug(f"{file_system=}")
+    assert len(disk_map) > 0, "file system is empty"
 
-    result = compute_file_system_checksum(file_system)
+    result = compact_checksum(disk_map)
 
     return f"{result=}"
 
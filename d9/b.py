@@ -1,206 +1,113 @@
+import dataclasses
+import heapq
 import logging
 import pathlib
 
+from aoc.metrics import phase
 from aoc.puzzle_input import read_input
 from aoc.solver import solver
 
 
-def first_empty(file_system: list[int], minbound: int) -> int:
-    cursor = minbound
+@dataclasses.dataclass(slots=True)
+class Extent:
+    start: int
+    size: int
+    file_id: int
 
-    while cursor < len(file_system):
-        if file_system[cursor] == -1:
-            return cursor
 
-        cursor += 1
+# disk map digits are single decimal digits, so no file is ever longer than this; gaps only grow past it when
+# they are joined across an empty file
+MAX_SPAN = 9
 
-    return -1
 
+@dataclasses.dataclass
+class FreeSpanIndex:
+    # heaps[n] holds the start offsets of every gap that is exactly n blocks long
+    heaps: list[list[int]]
 
-def last_non_empty(file_system: list[int], maxbound: int) -> int:
-    cursor = maxbound
+    def __init__(self):
+        self.heaps = [[] for _ in range(MAX_SPAN + 1)]
 
-    while cursor >= 0:
-        if file_system[cursor] > -1:
-            return cursor
+    def add(self, start: int, size: int) -> None:
+        if size > 0:
+            while len(self.heaps) <= size:
+                self.heaps.append([])
+            heapq.heappush(self.heaps[size], start)
 
-        cursor -= 1
+    def take(self, size: int, maxbound: int) -> int:
+        # leftmost gap of at least size blocks starting before maxbound; its unused tail goes back into the index
+        best_size = -1
 
-    return -1
+        for candidate_size in range(size, len(self.heaps)):
+            heap = self.heaps[candidate_size]
 
+            if heap and heap[0] < maxbound and (best_size < 0 or heap[0] < self.heaps[best_size][0]):
+                best_size = candidate_size
 
-def move_bit(file_system: list[int], source: int, target: int):
-    assert 0 <= source < len(file_system)
-    assert 0 <= target < len(file_system)
+        if best_size < 0:
+            return -1
 
-    file_system[target] = file_system[source]
-    file_system[source] = -1
+        start = heapq.heappop(self.heaps[best_size])
+        self.add(start + size, best_size - size)
+        return start
 
 
-def empty_span(file_system: list[int], minbound: int, maxbound: int) -> tuple[int, int, int, bool]:
-    left = first_empty(file_system, minbound)
+def create_extents(disk_map: list[int]) -> tuple[list[Extent], list[Extent]]:
+    # one extent per disk map digit, so memory follows the map length rather than the block count
+    files: list[Extent] = []
+    gaps: list[Extent] = []
+    position = 0
 
-    if left < 0:
-        return -1, -1, -1, False
+    for i, size in enumerate(disk_map):
+        if i % 2 == 0:
+            files.append(Extent(position, size, i // 2))
+        elif gaps and gaps[-1].start + gaps[-1].size == position:
+            # only an empty file separates this gap from the previous one, so they are one run of free blocks
+            gaps[-1].size += size
+        elif size > 0:
+            gaps.append(Extent(position, size, -1))
 
-    right = left
+        position += size
 
-    while True:
-        next_index = right + 1
+    return files, gaps
 
-        if next_index > maxbound:
-            return -1, -1, -1, False
 
-        if file_system[next_index] != -1:
-            return left, right, right - left + 1, True
+def compress_extents(files: list[Extent], gaps: list[Extent]) -> list[Extent]:
+    free_space = FreeSpanIndex()
 
-        right = next_index
+    for gap in gaps:
+        free_space.add(gap.start, gap.size)
 
+    # files only ever move left, so the space they vacate lies right of every file still to be placed and never
+    # needs to go back into the index
+    for file in reversed(files):
+        start = free_space.take(file.size, file.start)
 
-def file_span(file_system: list[int], minbound: int, maxbound: int) -> tuple[int, int, int, bool]:
-    right = last_non_empty(file_system, maxbound)
+        if start >= 0:
+            logging.debug(f"move file {file.file_id} from {file.start} to {start}")
+            file.start = start
 
-    if right < 0:
-        return -1, -1, -1, False
+    return files
 
-    left = right
 
-    while True:
-        next_index = left - 1
-
-        if next_index < minbound:
-            return -1, -1, -1, False
-
-        if file_system[next_index] != file_system[right]:
-            return left, right, right - left + 1, True
-
-        left = next_index
-
-
-def move_file(file_system: list[int], empty_span: tuple[int, int], file_span: tuple[int, int]):
-    for i in range(file_span[1] - file_span[0] + 1):
-        move_bit(file_system, file_span[0] + i, empty_span[0] + i)
-
-
-def trim_empty(file_system: list[int]) -> list[int]:
-    if len(file_system) == 0:
-        return []
-
-    cursor = len(file_system)
-
-    while file_system[cursor - 1] == -1:
-        cursor -= 1
-
-    return file_system[0:cursor]
-
-
-def find_free_space(file_system: list[int], minbound: int, maxbound: int, minsize: int) -> tuple[int, int, int, bool]:
-    left = minbound
-
-    while left <= maxbound:
-        if file_system[left] != -1:
-            left += 1
-            continue
-
-        right = left
-
-        while right <= maxbound:
-            next_index = right + 1
-
-            if file_system[next_index] >= 0:
-                break
-
-            right = next_index
-
-        size = right - left + 1
-
-        if size >= minsize:
-            return left, right, right - left + 1, True
-        else:
-            left = right + 1
-            right = left
-
-    return -1, -1, -1, False
-
-
-def file_system_to_string(file_system: list[int]) -> str:
-    output = ""
-
-    for x in file_system:
-        if x == -1:
-            output += "."
-        else:
-            output += str(x)
-
-    return output
-
-
-def compress_file_system(file_system: list[int]) -> list[int]:
-    logging.debug(f"{file_system_to_string(file_system)}")
-
-    file_left, file_right, file_size, file_ok = file_span(file_system, 0, len(file_system) - 1)
-
-    logging.debug(f"file span: {file_left=}, {file_right=}")
-
-    while file_ok:
-        empty_left, empty_right, empty_size, empty_ok = find_free_space(file_system, 0, file_left - 1, file_size)
-
-        if empty_ok:
-            logging.debug(f"compress {empty_size=} {file_size=}")
-            logging.debug(f"  target: ({empty_left}, {empty_right}) {file_system[empty_left:empty_right+1]}")
-            logging.debug(f"  source: ({file_left}, {file_right}) {file_system[file_left:file_right+1]}")
-
-            move_file(file_system, (empty_left, empty_right), (file_left, file_right))
-
-            logging.debug(f"{file_system_to_string(file_system)}")
-
-        file_left, file_right, file_size, file_ok = file_span(file_system, 0, file_left - 1)
-
-    return trim_empty(file_system)
-
-
-def create_file_system(disk_map: list[int]) -> list[int]:
-    file_system: list[int] = []
-    block_id = 0
-
-    for i, value in enumerate(disk_map):
-        is_block = i % 2 == 0
-
-        if is_block:
-            file_system += [block_id] * value
-            block_id += 1
-        else:
-            file_system += [-1] * value
-
-    return file_system
-
-
-def compute_file_system_checksum(file_system: list[int]) -> int:
-    result = 0
-
-    for i, value in enumerate(file_system):
-        if value != -1:
-            result += i * value
-
-    return result
+def extent_checksum(extent: Extent) -> int:
+    # file_id * (start + (start + 1) + ... + (start + size - 1))
+    return extent.file_id * (extent.size * extent.start + extent.size * (extent.size - 1) // 2)
 
 
 def solve(input_file: pathlib.Path) -> str:
-    disk_map = list(map(int, read_input(input_file).strip()))
+    with phase("parse"):
+        disk_map = list(map(int, read_input(input_file).strip()))
 
     logging.debug(f"{disk_map=}")
 
-    file_system = create_file_system(disk_map)
-
-    logging.debug(f"{file_system=}")
-
-    assert len(file_system) > 0, "file system is empty"
+    files, gaps = create_extents(disk_map)
 
-    file_system = compress_file_system(file_system)
+    assert len(files) > 0, "file system is empty"
 
-    logging.debug(f"{file_system=}")
+    files = compress_extents(files, gaps)
 
-    result = compute_file_system_checksum(file_system)
+    result = sum(map(extent_checksum, files))
 
     return f"{result=}"
 